@@ -1,24 +1,36 @@
 """Account API endpoints."""
 
+import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.core.auth import get_current_user
-from app.core.database import get_db
+from app.core.auth import get_current_environment, get_current_user
+from app.core.database_async import get_async_db
 from app.models.account import Account
 from app.models.user import User
 from app.schemas.account import AccountCreate, AccountResponse, AccountUpdate
-from app.services.settings_service import get_or_create_settings
 
 router = APIRouter()
 
 
+def visible_account(account_id: int, user: User, environment: str) -> Select[tuple[Account]]:
+    """Build a SELECT for one of the user's accounts in the given environment."""
+    return select(Account).where(
+        Account.id == account_id,
+        Account.user_id == user.id,
+        Account.environment == environment,
+    )
+
+
 @router.get("", response_model=list[AccountResponse])
-def list_accounts(
+async def list_accounts(
     active_only: bool = True,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    environment: str = Depends(get_current_environment),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[Account]:
     """
     List all accounts for the current environment.
@@ -26,28 +38,27 @@ def list_accounts(
     Args:
         active_only: Only return active accounts
         current_user: Current authenticated user
-        db: Database session
+        environment: Current Plaid environment
+        db: Async database session
 
     Returns:
         List of accounts
     """
-    # Get current environment from settings
-    settings = get_or_create_settings(db)
-
-    query = db.query(Account).filter(
+    stmt = select(Account).where(
         Account.user_id == current_user.id,
-        Account.environment == settings.plaid_environment,
+        Account.environment == environment,
     )
     if active_only:
-        query = query.filter(Account.is_active)
-    return query.all()
+        stmt = stmt.where(Account.is_active)
+    return list(await db.scalars(stmt))
 
 
 @router.get("/{account_id}", response_model=AccountResponse)
-def get_account(
+async def get_account(
     account_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    environment: str = Depends(get_current_environment),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Account:
     """
     Get a specific account by ID for the current environment.
@@ -55,33 +66,23 @@ def get_account(
     Args:
         account_id: Account ID
         current_user: Current authenticated user
-        db: Database session
+        environment: Current Plaid environment
+        db: Async database session
 
     Returns:
         Account details
     """
-    # Get current environment from settings
-    settings = get_or_create_settings(db)
-
-    account = (
-        db.query(Account)
-        .filter(
-            Account.id == account_id,
-            Account.user_id == current_user.id,
-            Account.environment == settings.plaid_environment,
-        )
-        .first()
-    )
+    account = await db.scalar(visible_account(account_id, current_user, environment))
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     return account
 
 
 @router.post("", response_model=AccountResponse, status_code=201)
-def create_account(
+async def create_account(
     account: AccountCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Account:
     """
     Create a new account.
@@ -89,14 +90,12 @@ def create_account(
     Args:
         account: Account data
         current_user: Current authenticated user
-        db: Database session
+        db: Async database session
 
     Returns:
         Created account
     """
     # Generate account ID
-    import uuid
-
     account_id = f"acc_{uuid.uuid4().hex[:12]}"
 
     db_account = Account(
@@ -105,17 +104,18 @@ def create_account(
         **account.model_dump(),
     )
     db.add(db_account)
-    db.commit()
-    db.refresh(db_account)
+    await db.commit()
+    await db.refresh(db_account)
     return db_account
 
 
 @router.patch("/{account_id}", response_model=AccountResponse)
-def update_account(
+async def update_account(
     account_id: int,
     account: AccountUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    environment: str = Depends(get_current_environment),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Account:
     """
     Update an account in the current environment.
@@ -124,23 +124,13 @@ def update_account(
         account_id: Account ID
         account: Updated account data
         current_user: Current authenticated user
-        db: Database session
+        environment: Current Plaid environment
+        db: Async database session
 
     Returns:
         Updated account
     """
-    # Get current environment from settings
-    settings = get_or_create_settings(db)
-
-    db_account = (
-        db.query(Account)
-        .filter(
-            Account.id == account_id,
-            Account.user_id == current_user.id,
-            Account.environment == settings.plaid_environment,
-        )
-        .first()
-    )
+    db_account = await db.scalar(visible_account(account_id, current_user, environment))
     if not db_account:
         raise HTTPException(status_code=404, detail="Account not found")
 
@@ -148,16 +138,17 @@ def update_account(
     for field, value in update_data.items():
         setattr(db_account, field, value)
 
-    db.commit()
-    db.refresh(db_account)
+    await db.commit()
+    await db.refresh(db_account)
     return db_account
 
 
 @router.delete("/{account_id}", status_code=204)
-def delete_account(
+async def delete_account(
     account_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    environment: str = Depends(get_current_environment),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
     """
     Delete an account in the current environment.
@@ -165,22 +156,18 @@ def delete_account(
     Args:
         account_id: Account ID
         current_user: Current authenticated user
-        db: Database session
+        environment: Current Plaid environment
+        db: Async database session
     """
-    # Get current environment from settings
-    settings = get_or_create_settings(db)
-
-    db_account = (
-        db.query(Account)
-        .filter(
-            Account.id == account_id,
-            Account.user_id == current_user.id,
-            Account.environment == settings.plaid_environment,
+    # Load transactions up front: the delete-orphan cascade can't lazy load
+    # them under an async session
+    db_account = await db.scalar(
+        visible_account(account_id, current_user, environment).options(
+            selectinload(Account.transactions)
         )
-        .first()
     )
     if not db_account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    db.delete(db_account)
-    db.commit()
+    await db.delete(db_account)
+    await db.commit()
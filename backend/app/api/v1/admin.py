@@ -3,10 +3,13 @@
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Body, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.core.auth import get_current_admin_user, get_password_hash
 from app.core.database import get_db
+from app.models.account import Account
+from app.models.category import Category
 from app.models.user import User
 from app.schemas.user import (
     UserCreate,
@@ -20,6 +23,28 @@ from app.services.category_service import seed_default_categories, seed_default_
 router = APIRouter()
 
 
+def user_data_loaders() -> list[LoaderOption]:
+    """
+    Build loader options that fetch everything a data reset deletes.
+
+    Each collection (and each child collection the deletes have to visit:
+    transactions under accounts and categories, sub-categories) comes back in
+    one IN query instead of one lazy SELECT per row.
+
+    Returns:
+        Options for a User query
+    """
+    return [
+        selectinload(User.accounts).selectinload(Account.transactions),
+        selectinload(User.transactions),
+        selectinload(User.categories).selectinload(Category.transactions),
+        selectinload(User.categories).selectinload(Category.children),
+        selectinload(User.rules),
+        selectinload(User.plaid_items),
+        selectinload(User.plaid_category_mappings),
+    ]
+
+
 @router.get("/users", response_model=list[UserResponse])
 def list_users(
     skip: int = 0,
@@ -256,7 +281,11 @@ def restore_user(
     Raises:
         HTTPException: If user not found or not archived
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    query = db.query(User).filter(User.id == user_id)
+    if not restore_options.restore_data:
+        # The reset below walks every collection; load them up front
+        query = query.options(*user_data_loaders())
+    user = query.first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
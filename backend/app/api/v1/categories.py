@@ -1,5 +1,6 @@
 """Category API endpoints."""
 
+from collections import defaultdict
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -72,9 +73,17 @@ def get_category_tree(
 
     categories = query.order_by(Category.display_order, Category.name).all()
 
+    # Group by parent once, keeping the display order within each group. The
+    # walk then reads each node's children directly instead of rescanning the
+    # whole list per node, and never touches the lazy parent/children
+    # relationships (one SELECT per node)
+    children_by_parent: dict[int | None, list[Category]] = defaultdict(list)
+    for category in categories:
+        children_by_parent[category.parent_id].append(category)
+
     # Helper function to build tree recursively
     def build_tree_node(category: Category) -> CategoryTreeNode:
-        node = CategoryTreeNode(
+        return CategoryTreeNode(
             id=category.id,
             name=category.name,
             display_name=category.display_name,
@@ -83,23 +92,11 @@ def get_category_tree(
             color=category.color,
             parent_id=category.parent_id,
             transaction_count=category.transaction_count,
-            children=[],
+            children=[build_tree_node(child) for child in children_by_parent[category.id]],
         )
 
-        # Find children
-        for cat in categories:
-            if cat.parent_id == category.id:
-                node.children.append(build_tree_node(cat))
-
-        return node
-
     # Build tree starting from root nodes (categories with no parent)
-    tree = []
-    for category in categories:
-        if category.parent_id is None:
-            tree.append(build_tree_node(category))
-
-    return tree
+    return [build_tree_node(category) for category in children_by_parent[None]]
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
@@ -1,7 +1,7 @@
 """Dashboard API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.auth import get_current_user
 from app.core.database import get_db
@@ -45,6 +45,7 @@ def get_tab(
     """Get a specific dashboard tab with its widgets."""
     tab = (
         db.query(DashboardTab)
+        .options(selectinload(DashboardTab.widgets))
         .filter(DashboardTab.id == tab_id, DashboardTab.user_id == current_user.id)
         .first()
     )
@@ -4,13 +4,14 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy.orm import Session
 
+from app.api.v1.setup import invalidate_setup_status_cache
 from app.core.auth import get_password_hash
 from app.core.database import get_db
 from app.core.limiter import limiter
 from app.models.user import User
 from app.services.category_service import seed_default_categories, seed_default_plaid_mappings
 from app.services.dashboard_service import create_default_dashboard
-from app.services.settings_service import get_or_create_settings
+from app.services.settings_service import get_or_create_settings, invalidate_settings_cache
 
 router = APIRouter()
 
@@ -157,6 +158,8 @@ def complete_onboarding(
 
         db.commit()
         db.refresh(admin_user)
+        invalidate_settings_cache()
+        invalidate_setup_status_cache()
 
         # Seed default categories for the new admin user
         seed_default_categories(db, admin_user.id)
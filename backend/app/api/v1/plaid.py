@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from app.core.auth import get_current_user
+from app.core.auth import get_current_environment, get_current_user
 from app.core.database import get_db
 from app.models.plaid_item import PlaidItem
 from app.models.user import User
@@ -280,6 +280,7 @@ def exchange_public_token(
 @router.get("/items", response_model=list[PlaidItemResponse])
 def list_plaid_items(
     current_user: User = Depends(get_current_user),
+    environment: str = Depends(get_current_environment),
     db: Session = Depends(get_db),
 ) -> list[PlaidItem]:
     """
@@ -287,20 +288,18 @@ def list_plaid_items(
 
     Args:
         current_user: Current authenticated user
+        environment: Current Plaid environment
         db: Database session
 
     Returns:
         List of Plaid items
     """
-    # Get current environment from settings
-    settings = get_or_create_settings(db)
-
     items = (
         db.query(PlaidItem)
         .filter(
             PlaidItem.user_id == current_user.id,
             PlaidItem.is_active,
-            PlaidItem.environment == settings.plaid_environment,
+            PlaidItem.environment == environment,
         )
         .all()
     )
@@ -311,6 +310,7 @@ def list_plaid_items(
 def get_plaid_item(
     item_id: int,
     current_user: User = Depends(get_current_user),
+    environment: str = Depends(get_current_environment),
     db: Session = Depends(get_db),
 ) -> PlaidItem:
     """
@@ -319,20 +319,18 @@ def get_plaid_item(
     Args:
         item_id: Plaid item ID
         current_user: Current authenticated user
+        environment: Current Plaid environment
         db: Database session
 
     Returns:
         Plaid item details
     """
-    # Get current environment from settings
-    settings = get_or_create_settings(db)
-
     item = (
         db.query(PlaidItem)
         .filter(
             PlaidItem.id == item_id,
             PlaidItem.user_id == current_user.id,
-            PlaidItem.environment == settings.plaid_environment,
+            PlaidItem.environment == environment,
         )
         .first()
     )
@@ -1,7 +1,9 @@
 """Rule API endpoints."""
 
+import json
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import delete, update
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user
@@ -76,8 +78,6 @@ def create_rule(
     Returns:
         Created rule
     """
-    import json
-
     rule_data = rule.model_dump()
     # Convert dicts to JSON strings
     rule_data["conditions"] = json.dumps(rule_data["conditions"])
@@ -99,7 +99,7 @@ def update_rule(
     rule: RuleUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> Rule:
+) -> RuleResponse:
     """
     Update a rule.
 
@@ -112,12 +112,6 @@ def update_rule(
     Returns:
         Updated rule
     """
-    import json
-
-    db_rule = db.query(Rule).filter(Rule.id == rule_id, Rule.user_id == current_user.id).first()
-    if not db_rule:
-        raise HTTPException(status_code=404, detail="Rule not found")
-
     update_data = rule.model_dump(exclude_unset=True)
     # Convert dicts to JSON strings
     if "conditions" in update_data:
@@ -125,12 +119,27 @@ def update_rule(
     if "actions" in update_data:
         update_data["actions"] = json.dumps(update_data["actions"])
 
-    for field, value in update_data.items():
-        setattr(db_rule, field, value)
+    # Single UPDATE ... RETURNING instead of SELECT + UPDATE; a missing row
+    # (or one owned by another user) comes back as None
+    stmt = (
+        update(Rule)
+        .where(Rule.id == rule_id, Rule.user_id == current_user.id)
+        .values(**update_data)
+    )
+    if db.get_bind().dialect.update_returning:
+        db_rule = db.scalars(stmt.returning(Rule)).one_or_none()
+    else:
+        # MySQL has no UPDATE ... RETURNING, so reload the row after updating
+        result = db.execute(stmt)
+        db_rule = db.get(Rule, rule_id) if result.rowcount else None
+    if not db_rule:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Rule not found")
 
+    # Serialize before commit expires the instance to avoid a reload SELECT
+    response = RuleResponse.model_validate(db_rule)
     db.commit()
-    db.refresh(db_rule)
-    return db_rule
+    return response
 
 
 @router.delete("/{rule_id}", status_code=204)
@@ -147,9 +156,10 @@ def delete_rule(
         current_user: Current authenticated user
         db: Database session
     """
-    db_rule = db.query(Rule).filter(Rule.id == rule_id, Rule.user_id == current_user.id).first()
-    if not db_rule:
+    # Rules have no dependent rows to cascade, so delete in one statement
+    result = db.execute(delete(Rule).where(Rule.id == rule_id, Rule.user_id == current_user.id))
+    if result.rowcount == 0:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Rule not found")
 
-    db.delete(db_rule)
     db.commit()
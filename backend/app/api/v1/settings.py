@@ -1,24 +1,46 @@
 """Settings API endpoints (Admin only)."""
 
+from enum import Enum
+
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_admin_user
 from app.core.database import get_db
 from app.models.user import User
-from app.services.settings_service import get_or_create_settings, update_plaid_settings
+from app.services.settings_service import (
+    get_or_create_settings,
+    get_settings_snapshot,
+    invalidate_settings_cache,
+    mask_secret,
+    update_plaid_settings,
+)
 
 router = APIRouter()
 
 
+class PlaidEnv(str, Enum):
+    """Plaid environments that can be selected from the admin UI."""
+
+    SANDBOX = "sandbox"
+    PRODUCTION = "production"
+
+
+class DatabaseType(str, Enum):
+    """Database backends that can be configured from the admin UI."""
+
+    SQLITE = "sqlite"
+    MYSQL = "mysql"
+
+
 class PlaidSettings(BaseModel):
     """Plaid API settings with environment-specific secrets."""
 
     client_id: str | None = None
     sandbox_secret: str | None = None
     production_secret: str | None = None
-    environment: str | None = None
+    environment: PlaidEnv | None = None
 
 
 class PlaidSettingsResponse(BaseModel):
@@ -33,7 +55,7 @@ class PlaidSettingsResponse(BaseModel):
 class DatabaseSettings(BaseModel):
     """Database configuration settings."""
 
-    database_type: str
+    database_type: DatabaseType
     database_host: str | None = None
     database_port: int | None = None
     database_name: str | None = None
@@ -41,6 +63,15 @@ class DatabaseSettings(BaseModel):
     database_password: str | None = None
     sqlite_path: str | None = None
 
+    @model_validator(mode="after")
+    def check_mysql_credentials(self) -> "DatabaseSettings":
+        """Require connection details when MySQL is selected."""
+        if self.database_type == DatabaseType.MYSQL and not all(
+            [self.database_host, self.database_name, self.database_user, self.database_password]
+        ):
+            raise ValueError("MySQL requires host, name, user, and password.")
+        return self
+
 
 class DatabaseSettingsResponse(BaseModel):
     """Database settings response (password is masked)."""
@@ -69,20 +100,12 @@ def get_plaid_settings(
     Returns:
         Plaid settings with masked secrets
     """
-    settings = get_or_create_settings(db)
-
-    def mask_secret(secret: str | None) -> str | None:
-        """Mask a secret for display."""
-        if not secret:
-            return None
-        if len(secret) > 8:
-            return f"{secret[:4]}...{secret[-4:]}"
-        return "****"
+    settings = get_settings_snapshot(db)
 
     return PlaidSettingsResponse(
         client_id=settings.plaid_client_id,
-        sandbox_secret_masked=mask_secret(settings.plaid_sandbox_secret),
-        production_secret_masked=mask_secret(settings.plaid_production_secret),
+        sandbox_secret_masked=settings.plaid_sandbox_secret_masked,
+        production_secret_masked=settings.plaid_production_secret_masked,
         environment=settings.plaid_environment,
     )
 
@@ -104,15 +127,6 @@ def update_plaid_settings_endpoint(
     Returns:
         Updated settings with masked secrets
     """
-    # Validate environment if provided
-    if settings.environment:
-        valid_envs = ["sandbox", "production"]
-        if settings.environment not in valid_envs:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid environment. Must be one of: {', '.join(valid_envs)}",
-            )
-
     try:
         # Update settings in database
         updated_settings = update_plaid_settings(
@@ -120,17 +134,9 @@ def update_plaid_settings_endpoint(
             client_id=settings.client_id,
             sandbox_secret=settings.sandbox_secret,
             production_secret=settings.production_secret,
-            environment=settings.environment,
+            environment=settings.environment.value if settings.environment else None,
         )
 
-        def mask_secret(secret: str | None) -> str | None:
-            """Mask a secret for display."""
-            if not secret:
-                return None
-            if len(secret) > 8:
-                return f"{secret[:4]}...{secret[-4:]}"
-            return "****"
-
         return PlaidSettingsResponse(
             client_id=updated_settings.plaid_client_id,
             sandbox_secret_masked=mask_secret(updated_settings.plaid_sandbox_secret),
@@ -156,15 +162,7 @@ def get_database_settings(
     Returns:
         Database settings with masked password
     """
-    settings = get_or_create_settings(db)
-
-    def mask_password(password: str | None) -> str | None:
-        """Mask a password for display."""
-        if not password:
-            return None
-        if len(password) > 8:
-            return f"{password[:2]}...{password[-2:]}"
-        return "****"
+    settings = get_settings_snapshot(db)
 
     return DatabaseSettingsResponse(
         database_type=settings.database_type,
@@ -172,7 +170,7 @@ def get_database_settings(
         database_port=settings.database_port,
         database_name=settings.database_name,
         database_user=settings.database_user,
-        database_password_masked=mask_password(settings.database_password),
+        database_password_masked=settings.database_password_masked,
         sqlite_path=settings.sqlite_path,
     )
 
@@ -197,35 +195,13 @@ def update_database_settings_endpoint(
     Returns:
         Updated database settings with masked password
     """
-    # Validate database type
-    if settings.database_type not in ["sqlite", "mysql"]:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid database type. Must be 'sqlite' or 'mysql'.",
-        )
-
-    # Validate MySQL settings if MySQL is selected
-    if settings.database_type == "mysql":
-        if not all(
-            [
-                settings.database_host,
-                settings.database_name,
-                settings.database_user,
-                settings.database_password,
-            ]
-        ):
-            raise HTTPException(
-                status_code=400,
-                detail="MySQL requires host, name, user, and password.",
-            )
-
     try:
         # Get current settings
         app_settings = get_or_create_settings(db)
 
         # Update database configuration
-        app_settings.database_type = settings.database_type
-        if settings.database_type == "mysql":
+        app_settings.database_type = settings.database_type.value
+        if settings.database_type == DatabaseType.MYSQL:
             app_settings.database_host = settings.database_host
             app_settings.database_port = settings.database_port
             app_settings.database_name = settings.database_name
@@ -236,26 +212,22 @@ def update_database_settings_endpoint(
             if settings.sqlite_path:
                 app_settings.sqlite_path = settings.sqlite_path
 
-        db.commit()
-        db.refresh(app_settings)
-
-        def mask_password(password: str | None) -> str | None:
-            """Mask a password for display."""
-            if not password:
-                return None
-            if len(password) > 8:
-                return f"{password[:2]}...{password[-2:]}"
-            return "****"
-
-        return DatabaseSettingsResponse(
+        # Build the response from the values we just wrote, before commit expires
+        # them, so we don't need a refresh SELECT afterwards
+        response = DatabaseSettingsResponse(
             database_type=app_settings.database_type,
             database_host=app_settings.database_host,
             database_port=app_settings.database_port,
             database_name=app_settings.database_name,
             database_user=app_settings.database_user,
-            database_password_masked=mask_password(app_settings.database_password),
+            database_password_masked=mask_secret(app_settings.database_password, visible=2),
             sqlite_path=app_settings.sqlite_path,
         )
+
+        db.commit()
+        invalidate_settings_cache()
+
+        return response
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e)) from e
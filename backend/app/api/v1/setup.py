@@ -1,14 +1,23 @@
 """Interactive setup wizard API for first-time deployment configuration."""
 
+import base64
+import copy
+import hashlib
+import math
 import os
+import secrets
+import time
+from dataclasses import dataclass
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from pydantic import BaseModel, Field
-from sqlalchemy import text
+from sqlalchemy import create_engine, exists, make_url, text
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 
 from app.core.database import get_db
+from app.core.limiter import limiter
 from app.models.user import User
 
 router = APIRouter()
@@ -27,6 +36,76 @@ class SetupStatusResponse(BaseModel):
     setup_steps_remaining: list[str]
 
 
+# Upper bound on how long test-database waits to establish a connection
+TEST_DATABASE_CONNECT_TIMEOUT_SECONDS = 5
+
+# Database types recognised from the DATABASE_URL scheme (ignoring any +driver)
+DATABASE_TYPES_BY_SCHEME = {"postgresql": "postgresql", "mysql": "mysql", "sqlite": "sqlite"}
+
+
+@dataclass(frozen=True, slots=True)
+class SetupEnvironment:
+    """
+    Setup-relevant environment variables, read once.
+
+    Environment variables can't change for the life of the process, so the
+    setup endpoints use this snapshot instead of calling os.getenv per request.
+    """
+
+    has_encryption_key: bool
+    has_secret_key: bool
+    has_plaid_credentials: bool
+    database_url: str
+    database_type: str | None
+    has_rds: bool
+    running_on_ecs: bool
+
+    @classmethod
+    def from_env(cls) -> "SetupEnvironment":
+        """Build a snapshot from the current process environment."""
+        database_url = os.getenv("DATABASE_URL", "")
+        scheme = database_url.split(":", 1)[0].split("+", 1)[0]
+        return cls(
+            has_encryption_key=bool(os.getenv("ENCRYPTION_KEY")),
+            has_secret_key=bool(os.getenv("SECRET_KEY")),
+            has_plaid_credentials=bool(os.getenv("PLAID_CLIENT_ID"))
+            and bool(os.getenv("PLAID_SECRET")),
+            database_url=database_url,
+            database_type=DATABASE_TYPES_BY_SCHEME.get(scheme),
+            has_rds="amazonaws.com" in database_url or "rds" in database_url,
+            running_on_ecs=bool(os.getenv("ECS_CONTAINER_METADATA_URI")),
+        )
+
+
+setup_env = SetupEnvironment.from_env()
+
+# How long an incomplete setup status is served from memory. Once setup is
+# complete the status can't change without a restart, so it is kept forever.
+SETUP_STATUS_CACHE_TTL_SECONDS = 30.0
+
+# (expires_at, response) for the process-wide setup status cache
+_setup_status_cache: tuple[float, SetupStatusResponse] | None = None
+
+
+def invalidate_setup_status_cache() -> None:
+    """Drop the cached setup status so the next request recomputes it."""
+    global _setup_status_cache
+    _setup_status_cache = None
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag from the values a response is derived from."""
+    return f'"{hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already matches etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
+
+
 class DatabaseTestRequest(BaseModel):
     """Request schema for testing database connection."""
 
@@ -49,40 +128,66 @@ class EncryptionKeyGenerateResponse(BaseModel):
 
 
 @router.get("/status", response_model=SetupStatusResponse)
-def get_setup_status(db: Session = Depends(get_db)) -> SetupStatusResponse:
+def get_setup_status(
+    request: Request, response: Response, db: Session = Depends(get_db)
+) -> SetupStatusResponse | Response:
     """
     Get current setup status and determine which steps remain.
 
     This endpoint helps guide users through the initial setup process by
     checking what configuration is complete and what still needs to be done.
 
+    The response carries an ETag; polls sending a matching If-None-Match get
+    an empty 304 Not Modified.
+
     Returns:
         SetupStatusResponse: Current setup status and remaining steps
     """
+    status = load_setup_status(db)
+    # Only the inputs of the response: hashing setup_env itself would put a
+    # digest of DATABASE_URL (and its password) in an unauthenticated header
+    etag = make_etag(
+        status.has_admin_user,
+        setup_env.has_encryption_key,
+        setup_env.has_secret_key,
+        setup_env.has_plaid_credentials,
+        setup_env.database_type,
+    )
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return status
+
+
+def load_setup_status(db: Session) -> SetupStatusResponse:
+    """
+    Compute the setup status.
+
+    The result is cached in process memory (see SETUP_STATUS_CACHE_TTL_SECONDS),
+    since the setup wizard polls the status endpoint.
+
+    Args:
+        db: Database session (only used on a cache miss)
+
+    Returns:
+        SetupStatusResponse: Current setup status and remaining steps
+    """
+    global _setup_status_cache
+
+    now = time.monotonic()
+    if _setup_status_cache is not None and _setup_status_cache[0] > now:
+        return _setup_status_cache[1]
+
     # Check if admin user exists
-    has_admin_user = db.query(User).filter(User.is_admin == True).count() > 0  # noqa: E712
+    has_admin_user = db.query(exists().where(User.is_admin.is_(True))).scalar()
 
     # Check environment variables
-    has_encryption_key = bool(os.getenv("ENCRYPTION_KEY"))
-    has_secret_key = bool(os.getenv("SECRET_KEY"))
-    has_plaid_client = bool(os.getenv("PLAID_CLIENT_ID"))
-    has_plaid_secret = bool(os.getenv("PLAID_SECRET"))
-    has_plaid_credentials = has_plaid_client and has_plaid_secret
-
-    # Determine database type
-    database_url = os.getenv("DATABASE_URL", "")
-    if "postgresql" in database_url:
-        database_type = "postgresql"
-        has_database = True
-    elif "mysql" in database_url:
-        database_type = "mysql"
-        has_database = True
-    elif "sqlite" in database_url:
-        database_type = "sqlite"
-        has_database = True
-    else:
-        database_type = None
-        has_database = False
+    has_encryption_key = setup_env.has_encryption_key
+    has_secret_key = setup_env.has_secret_key
+    has_plaid_credentials = setup_env.has_plaid_credentials
+    database_type = setup_env.database_type
+    has_database = database_type is not None
 
     # Determine remaining steps
     steps_remaining = []
@@ -99,7 +204,7 @@ def get_setup_status(db: Session = Depends(get_db)) -> SetupStatusResponse:
 
     needs_setup = len(steps_remaining) > 0
 
-    return SetupStatusResponse(
+    response = SetupStatusResponse(
         needs_setup=needs_setup,
         has_admin_user=has_admin_user,
         has_database=has_database,
@@ -109,56 +214,68 @@ def get_setup_status(db: Session = Depends(get_db)) -> SetupStatusResponse:
         database_type=database_type,
         setup_steps_remaining=steps_remaining,
     )
+    expires_at = now + SETUP_STATUS_CACHE_TTL_SECONDS if needs_setup else math.inf
+    _setup_status_cache = (expires_at, response)
+    return response
 
 
 @router.post("/test-database", response_model=DatabaseTestResponse)
-def test_database_connection(request: DatabaseTestRequest) -> DatabaseTestResponse:
+@limiter.limit("10/minute")
+def test_database_connection(
+    request: Request, test_request: DatabaseTestRequest
+) -> DatabaseTestResponse:
     """
     Test database connection with provided credentials.
 
     This endpoint allows users to verify their database configuration
     before saving it permanently. Useful for AWS RDS setup.
 
+    Only a single connection is opened (no pool), with a connect timeout so
+    an unreachable host cannot tie up a worker. Rate limited since every
+    call touches the network.
+
     Args:
-        request: Database connection details
+        request: FastAPI request object (required for rate limiting)
+        test_request: Database connection details
 
     Returns:
         DatabaseTestResponse: Connection test results
     """
     try:
-        from sqlalchemy import create_engine
-
-        # Create temporary engine with provided URL
-        test_engine = create_engine(request.database_url, pool_pre_ping=True)
-
-        # Test connection
-        with test_engine.connect() as connection:
-            result = connection.execute(text("SELECT version()"))
-            version = result.scalar()
-
-            # Get additional info
-            if "postgresql" in request.database_url:
-                db_info = connection.execute(
-                    text(
-                        "SELECT current_database(), current_user, inet_server_addr(), inet_server_port()"
-                    )
-                ).first()
-
-                details = {
-                    "database_type": "PostgreSQL",
-                    "version": version,
-                    "database": db_info[0] if db_info else None,
-                    "user": db_info[1] if db_info else None,
-                    "host": str(db_info[2]) if db_info and db_info[2] else None,
-                    "port": db_info[3] if db_info else None,
-                }
-            else:
-                details = {
-                    "database_type": "MySQL/MariaDB",
-                    "version": version,
-                }
-
-        test_engine.dispose()
+        url = make_url(test_request.database_url)
+        test_engine = create_engine(
+            url,
+            poolclass=NullPool,
+            connect_args={"connect_timeout": TEST_DATABASE_CONNECT_TIMEOUT_SECONDS},
+        )
+
+        try:
+            with test_engine.connect() as connection:
+                version = connection.execute(text("SELECT version()")).scalar()
+
+                # Get additional info
+                if url.get_backend_name() == "postgresql":
+                    db_info = connection.execute(
+                        text(
+                            "SELECT current_database(), current_user, inet_server_addr(), inet_server_port()"
+                        )
+                    ).first()
+
+                    details = {
+                        "database_type": "PostgreSQL",
+                        "version": version,
+                        "database": db_info[0] if db_info else None,
+                        "user": db_info[1] if db_info else None,
+                        "host": str(db_info[2]) if db_info and db_info[2] else None,
+                        "port": db_info[3] if db_info else None,
+                    }
+                else:
+                    details = {
+                        "database_type": "MySQL/MariaDB",
+                        "version": version,
+                    }
+        finally:
+            test_engine.dispose()
 
         return DatabaseTestResponse(
             success=True,
@@ -205,9 +322,8 @@ def generate_encryption_key() -> EncryptionKeyGenerateResponse:
     Returns:
         EncryptionKeyGenerateResponse: Generated key and storage instructions
     """
-    from cryptography.fernet import Fernet
-
-    encryption_key = Fernet.generate_key().decode()
+    # Same format as Fernet.generate_key(): url-safe base64 of 32 random bytes
+    encryption_key = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode()
 
     instructions = """
 IMPORTANT: Save this encryption key securely!
@@ -242,8 +358,6 @@ def generate_secret_key() -> dict[str, str]:
     Returns:
         dict: Generated secret key and storage instructions
     """
-    import secrets
-
     secret_key = secrets.token_hex(32)
 
     instructions = """
@@ -265,162 +379,201 @@ For .env file (development only):
     }
 
 
-@router.get("/aws-checklist")
-def get_aws_setup_checklist() -> dict[str, Any]:
+# Static AWS deployment checklist. Steps whose status depends on the
+# environment are "pending" here and patched per request (see the *_STEPS
+# constants below), so each request only copies this instead of rebuilding it.
+AWS_CHECKLIST_TEMPLATE: dict[str, Any] = {
+    "infrastructure": {
+        "title": "AWS Infrastructure Setup",
+        "steps": [
+            {
+                "name": "Create VPC and subnets",
+                "status": "unknown",
+                "required": True,
+                "instructions": "See DEPLOYMENT_AWS.md Step 1.1",
+            },
+            {
+                "name": "Create security groups",
+                "status": "unknown",
+                "required": True,
+                "instructions": "See DEPLOYMENT_AWS.md Step 1.2",
+            },
+            {
+                "name": "Create RDS PostgreSQL instance",
+                "status": "pending",
+                "required": True,
+                "instructions": "See DEPLOYMENT_AWS.md Step 1.3",
+            },
+            {
+                "name": "Create Secrets Manager secrets",
+                "status": "pending",
+                "required": True,
+                "instructions": "See DEPLOYMENT_AWS.md Step 1.4",
+            },
+            {
+                "name": "Create S3 bucket for beancount files",
+                "status": "unknown",
+                "required": False,
+                "instructions": "See DEPLOYMENT_AWS.md Step 1.5",
+            },
+        ],
+    },
+    "application": {
+        "title": "Application Deployment",
+        "steps": [
+            {
+                "name": "Build and push Docker images to ECR",
+                "status": "unknown",
+                "required": True,
+                "instructions": "See DEPLOYMENT_AWS.md Step 2",
+            },
+            {
+                "name": "Create ECS cluster and services",
+                "status": "pending",
+                "required": True,
+                "instructions": "See DEPLOYMENT_AWS.md Step 3",
+            },
+            {
+                "name": "Configure Application Load Balancer",
+                "status": "unknown",
+                "required": True,
+                "instructions": "See DEPLOYMENT_AWS.md Step 3.5",
+            },
+            {
+                "name": "Set up DNS and SSL certificate",
+                "status": "unknown",
+                "required": True,
+                "instructions": "See DEPLOYMENT_AWS.md Step 4",
+            },
+        ],
+    },
+    "configuration": {
+        "title": "Application Configuration",
+        "steps": [
+            {
+                "name": "Set ENCRYPTION_KEY in Secrets Manager",
+                "status": "pending",
+                "required": True,
+                "instructions": "Use /setup/generate-encryption-key endpoint",
+            },
+            {
+                "name": "Set SECRET_KEY in Secrets Manager",
+                "status": "pending",
+                "required": True,
+                "instructions": "Use /setup/generate-secret-key endpoint",
+            },
+            {
+                "name": "Configure DATABASE_URL",
+                "status": "pending",
+                "required": True,
+                "instructions": "Use /setup/test-database endpoint to verify",
+            },
+            {
+                "name": "Create admin user",
+                "status": "unknown",
+                "required": True,
+                "instructions": "Use /onboarding/complete endpoint after setup",
+            },
+            {
+                "name": "Configure Plaid credentials",
+                "status": "unknown",
+                "required": False,
+                "instructions": "Set via application settings after onboarding",
+            },
+        ],
+    },
+    "monitoring": {
+        "title": "Monitoring and Observability (Optional)",
+        "steps": [
+            {
+                "name": "Set up CloudWatch alarms",
+                "status": "unknown",
+                "required": False,
+                "instructions": "Configure alarms for ECS, RDS, ALB health",
+            },
+            {
+                "name": "Configure error tracking (Sentry/GlitchTip)",
+                "status": "unknown",
+                "required": False,
+                "instructions": "Set SENTRY_DSN environment variable",
+            },
+            {
+                "name": "Enable RDS enhanced monitoring",
+                "status": "unknown",
+                "required": False,
+                "instructions": "Enable in RDS console",
+            },
+        ],
+    },
+}
+
+
+# (section, step index) of checklist steps whose status is detected at runtime
+RDS_STEPS = (("infrastructure", 2), ("configuration", 2))
+SECRETS_MANAGER_STEP = ("infrastructure", 3)
+ECS_STEP = ("application", 1)
+ENCRYPTION_KEY_STEP = ("configuration", 0)
+SECRET_KEY_STEP = ("configuration", 1)
+
+TOTAL_REQUIRED_STEPS = sum(
+    step["required"] for section in AWS_CHECKLIST_TEMPLATE.values() for step in section["steps"]
+)
+
+
+@router.get("/aws-checklist", response_model=None)
+def get_aws_setup_checklist(request: Request, response: Response) -> dict[str, Any] | Response:
     """
     Get AWS deployment checklist with current status.
 
     Provides a comprehensive checklist for AWS deployment including
     RDS, Secrets Manager, ECS, and other AWS services.
 
+    The checklist only depends on the environment, so the response carries an
+    ETag derived from the environment flags it uses; polls sending a matching
+    If-None-Match get an empty 304 Not Modified without the checklist being
+    built.
+
     Returns:
         dict: Checklist with status and instructions
     """
+    etag = make_etag(
+        setup_env.has_encryption_key,
+        setup_env.has_secret_key,
+        setup_env.has_rds,
+        setup_env.running_on_ecs,
+        bool(setup_env.database_url),
+    )
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     # Get current status
-    has_encryption_key = bool(os.getenv("ENCRYPTION_KEY"))
-    has_secret_key = bool(os.getenv("SECRET_KEY"))
-    database_url = os.getenv("DATABASE_URL", "")
-    has_rds = "amazonaws.com" in database_url or "rds" in database_url
-
-    # Check if running in AWS (basic detection)
-    ecs_metadata = os.getenv("ECS_CONTAINER_METADATA_URI")
-    running_on_ecs = bool(ecs_metadata)
-
-    checklist = {
-        "infrastructure": {
-            "title": "AWS Infrastructure Setup",
-            "steps": [
-                {
-                    "name": "Create VPC and subnets",
-                    "status": "unknown",
-                    "required": True,
-                    "instructions": "See DEPLOYMENT_AWS.md Step 1.1",
-                },
-                {
-                    "name": "Create security groups",
-                    "status": "unknown",
-                    "required": True,
-                    "instructions": "See DEPLOYMENT_AWS.md Step 1.2",
-                },
-                {
-                    "name": "Create RDS PostgreSQL instance",
-                    "status": "complete" if has_rds else "pending",
-                    "required": True,
-                    "instructions": "See DEPLOYMENT_AWS.md Step 1.3",
-                },
-                {
-                    "name": "Create Secrets Manager secrets",
-                    "status": "complete" if (has_encryption_key and has_secret_key) else "pending",
-                    "required": True,
-                    "instructions": "See DEPLOYMENT_AWS.md Step 1.4",
-                },
-                {
-                    "name": "Create S3 bucket for beancount files",
-                    "status": "unknown",
-                    "required": False,
-                    "instructions": "See DEPLOYMENT_AWS.md Step 1.5",
-                },
-            ],
-        },
-        "application": {
-            "title": "Application Deployment",
-            "steps": [
-                {
-                    "name": "Build and push Docker images to ECR",
-                    "status": "unknown",
-                    "required": True,
-                    "instructions": "See DEPLOYMENT_AWS.md Step 2",
-                },
-                {
-                    "name": "Create ECS cluster and services",
-                    "status": "complete" if running_on_ecs else "pending",
-                    "required": True,
-                    "instructions": "See DEPLOYMENT_AWS.md Step 3",
-                },
-                {
-                    "name": "Configure Application Load Balancer",
-                    "status": "unknown",
-                    "required": True,
-                    "instructions": "See DEPLOYMENT_AWS.md Step 3.5",
-                },
-                {
-                    "name": "Set up DNS and SSL certificate",
-                    "status": "unknown",
-                    "required": True,
-                    "instructions": "See DEPLOYMENT_AWS.md Step 4",
-                },
-            ],
-        },
-        "configuration": {
-            "title": "Application Configuration",
-            "steps": [
-                {
-                    "name": "Set ENCRYPTION_KEY in Secrets Manager",
-                    "status": "complete" if has_encryption_key else "pending",
-                    "required": True,
-                    "instructions": "Use /setup/generate-encryption-key endpoint",
-                },
-                {
-                    "name": "Set SECRET_KEY in Secrets Manager",
-                    "status": "complete" if has_secret_key else "pending",
-                    "required": True,
-                    "instructions": "Use /setup/generate-secret-key endpoint",
-                },
-                {
-                    "name": "Configure DATABASE_URL",
-                    "status": "complete" if has_rds else "pending",
-                    "required": True,
-                    "instructions": "Use /setup/test-database endpoint to verify",
-                },
-                {
-                    "name": "Create admin user",
-                    "status": "unknown",
-                    "required": True,
-                    "instructions": "Use /onboarding/complete endpoint after setup",
-                },
-                {
-                    "name": "Configure Plaid credentials",
-                    "status": "unknown",
-                    "required": False,
-                    "instructions": "Set via application settings after onboarding",
-                },
-            ],
-        },
-        "monitoring": {
-            "title": "Monitoring and Observability (Optional)",
-            "steps": [
-                {
-                    "name": "Set up CloudWatch alarms",
-                    "status": "unknown",
-                    "required": False,
-                    "instructions": "Configure alarms for ECS, RDS, ALB health",
-                },
-                {
-                    "name": "Configure error tracking (Sentry/GlitchTip)",
-                    "status": "unknown",
-                    "required": False,
-                    "instructions": "Set SENTRY_DSN environment variable",
-                },
-                {
-                    "name": "Enable RDS enhanced monitoring",
-                    "status": "unknown",
-                    "required": False,
-                    "instructions": "Enable in RDS console",
-                },
-            ],
-        },
-    }
+    has_encryption_key = setup_env.has_encryption_key
+    has_secret_key = setup_env.has_secret_key
+    has_rds = setup_env.has_rds
+    running_on_ecs = setup_env.running_on_ecs
 
-    # Calculate overall progress
-    total_required = 0
-    completed_required = 0
+    checklist = copy.deepcopy(AWS_CHECKLIST_TEMPLATE)
 
-    for section in checklist.values():
-        for step in section["steps"]:
-            if step["required"]:
-                total_required += 1
-                if step["status"] == "complete":
-                    completed_required += 1
+    def mark(step: tuple[str, int], complete: bool) -> None:
+        if complete:
+            section, index = step
+            checklist[section]["steps"][index]["status"] = "complete"
+
+    for step in RDS_STEPS:
+        mark(step, has_rds)
+    mark(SECRETS_MANAGER_STEP, has_encryption_key and has_secret_key)
+    mark(ECS_STEP, running_on_ecs)
+    mark(ENCRYPTION_KEY_STEP, has_encryption_key)
+    mark(SECRET_KEY_STEP, has_secret_key)
+
+    # Calculate overall progress
+    total_required = TOTAL_REQUIRED_STEPS
+    completed_required = sum(
+        step["required"] and step["status"] == "complete"
+        for section in checklist.values()
+        for step in section["steps"]
+    )
 
     progress = {
         "total_required_steps": total_required,
@@ -437,7 +590,7 @@ def get_aws_setup_checklist() -> dict[str, Any]:
         "environment": {
             "running_on_ecs": running_on_ecs,
             "has_rds": has_rds,
-            "database_url_configured": bool(database_url),
+            "database_url_configured": bool(setup_env.database_url),
         },
     }
 
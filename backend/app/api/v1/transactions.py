@@ -1,10 +1,17 @@
 """Transaction API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-
-from app.core.auth import get_current_user
-from app.core.database import get_db
+import secrets
+from datetime import date, datetime
+from typing import TypeGuard
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from sqlalchemy import func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.auth import get_current_environment, get_current_user
+from app.core.database_async import get_async_db
+from app.models.account import Account
 from app.models.transaction import Transaction
 from app.models.user import User
 from app.schemas.transaction import (
@@ -13,22 +20,61 @@ from app.schemas.transaction import (
     TransactionResponse,
     TransactionUpdate,
 )
-from app.services.settings_service import get_or_create_settings
 
 router = APIRouter()
 
+# Upper bound on transactions accepted by a single bulk create request
+MAX_BULK_TRANSACTIONS = 1000
+
+
+def generate_transaction_id() -> str:
+    """Generate a unique ID for a manually created transaction."""
+    return f"txn_{secrets.token_urlsafe(9)}"
+
+
+def is_visible(
+    transaction: Transaction | None, user: User, environment: str
+) -> TypeGuard[Transaction]:
+    """Check a transaction loaded by primary key belongs to the user and environment."""
+    return bool(
+        transaction is not None
+        and transaction.user_id == user.id
+        and transaction.environment == environment
+    )
+
+
+def encode_cursor(transaction: Transaction) -> str:
+    """Build a keyset pagination cursor ("<iso date>:<id>") from a transaction."""
+    return f"{transaction.date.isoformat()}:{transaction.id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Parse a keyset pagination cursor produced by encode_cursor().
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    date_part, _, id_part = cursor.rpartition(":")
+    try:
+        return datetime.fromisoformat(date_part), int(id_part)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
 
 @router.get("", response_model=TransactionListResponse)
-def list_transactions(
+async def list_transactions(
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
     account_id: int | None = None,
     category_id: int | None = None,
-    start_date: str | None = None,
-    end_date: str | None = None,
+    start_date: date | None = Query(None),
+    end_date: date | None = Query(None),
     search: str | None = None,
+    cursor: str | None = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    environment: str = Depends(get_current_environment),
+    db: AsyncSession = Depends(get_async_db),
 ) -> TransactionListResponse:
     """
     List transactions with pagination and filters for the current environment.
@@ -38,45 +84,77 @@ def list_transactions(
         page_size: Number of items per page
         account_id: Filter by account ID
         category_id: Filter by category ID
-        start_date: Filter by start date (ISO format)
-        end_date: Filter by end date (ISO format)
-        search: Search in description and payee
+        start_date: Filter by start date (ISO format, parsed before querying)
+        end_date: Filter by end date (ISO format, parsed before querying)
+        search: Search in description and payee (blank searches are ignored)
+        cursor: Keyset cursor (next_cursor from the previous page); when set,
+            the page after the cursor is returned and page is ignored
         current_user: Current authenticated user
-        db: Database session
+        environment: Current Plaid environment
+        db: Async database session
 
     Returns:
         Paginated list of transactions
     """
-    # Get current environment from settings
-    settings = get_or_create_settings(db)
-
-    query = db.query(Transaction).filter(
+    filters = [
         Transaction.user_id == current_user.id,
-        Transaction.environment == settings.plaid_environment,
-    )
+        Transaction.environment == environment,
+    ]
 
     # Apply filters
     if account_id:
-        query = query.filter(Transaction.account_id == account_id)
+        filters.append(Transaction.account_id == account_id)
     if category_id:
-        query = query.filter(Transaction.category_id == category_id)
+        filters.append(Transaction.category_id == category_id)
     if start_date:
-        query = query.filter(Transaction.date >= start_date)
+        filters.append(Transaction.date >= start_date)
     if end_date:
-        query = query.filter(Transaction.date <= end_date)
+        filters.append(Transaction.date <= end_date)
+    search = search.strip() if search else None
     if search:
-        search_filter = f"%{search}%"
-        query = query.filter(
-            (Transaction.description.ilike(search_filter))
-            | (Transaction.payee.ilike(search_filter))
+        # Escape LIKE wildcards in user input; search_text matches the trigram index
+        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        filters.append(Transaction.search_text.ilike(f"%{escaped}%", escape="\\"))
+
+    # (date, id) ordering matches ix_transactions_user_env_date_id and gives
+    # keyset pagination a stable tie-breaker
+    order_by = (Transaction.date.desc(), Transaction.id.desc())
+
+    if cursor:
+        # Keyset pagination: seek straight past the previous page instead of
+        # scanning and discarding OFFSET rows
+        cursor_date, cursor_id = decode_cursor(cursor)
+        stmt = (
+            select(Transaction)
+            .where(*filters, tuple_(Transaction.date, Transaction.id) < (cursor_date, cursor_id))
+            .options(selectinload(Transaction.category))
+            .order_by(*order_by)
+            .limit(page_size)
         )
-
-    # Get total count
-    total = query.count()
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    transactions = query.order_by(Transaction.date.desc()).offset(offset).limit(page_size).all()
+        transactions = list((await db.scalars(stmt)).all())
+        total = await db.scalar(select(func.count()).select_from(Transaction).where(*filters)) or 0
+    else:
+        # Fetch the page and the total in one round trip via COUNT(*) OVER ()
+        offset = (page - 1) * page_size
+        page_stmt = (
+            select(Transaction, func.count().over().label("total"))
+            .where(*filters)
+            .options(selectinload(Transaction.category))
+            .order_by(*order_by)
+            .offset(offset)
+            .limit(page_size)
+        )
+        rows = (await db.execute(page_stmt)).all()
+        transactions = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Past the last page there are no rows to carry the total
+            total = (
+                await db.scalar(select(func.count()).select_from(Transaction).where(*filters)) or 0
+            )
+        else:
+            total = 0
 
     total_pages = (total + page_size - 1) // page_size
 
@@ -86,14 +164,16 @@ def list_transactions(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=encode_cursor(transactions[-1]) if len(transactions) == page_size else None,
     )
 
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
-def get_transaction(
+async def get_transaction(
     transaction_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    environment: str = Depends(get_current_environment),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Transaction:
     """
     Get a specific transaction by ID for the current environment.
@@ -101,78 +181,148 @@ def get_transaction(
     Args:
         transaction_id: Transaction ID
         current_user: Current authenticated user
-        db: Database session
+        environment: Current Plaid environment
+        db: Async database session
 
     Returns:
         Transaction details
     """
-    # Get current environment from settings
-    settings = get_or_create_settings(db)
-
-    transaction = (
-        db.query(Transaction)
-        .filter(
-            Transaction.id == transaction_id,
-            Transaction.user_id == current_user.id,
-            Transaction.environment == settings.plaid_environment,
-        )
-        .first()
+    transaction = await db.get(
+        Transaction, transaction_id, options=[selectinload(Transaction.category)]
     )
-    if not transaction:
+    if not is_visible(transaction, current_user, environment):
         raise HTTPException(status_code=404, detail="Transaction not found")
     return transaction
 
 
 @router.post("", response_model=TransactionResponse, status_code=201)
-def create_transaction(
+async def create_transaction(
     transaction: TransactionCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    environment: str = Depends(get_current_environment),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Transaction:
     """
-    Create a new transaction.
+    Create a new transaction in the current environment.
 
     Args:
         transaction: Transaction data
         current_user: Current authenticated user
-        db: Database session
+        environment: Current Plaid environment
+        db: Async database session
 
     Returns:
         Created transaction
     """
     # Validate account exists and belongs to user
-    from app.models.account import Account
-
-    account = (
-        db.query(Account)
-        .filter(Account.id == transaction.account_id, Account.user_id == current_user.id)
-        .first()
+    account = await db.scalar(
+        select(Account).where(
+            Account.id == transaction.account_id, Account.user_id == current_user.id
+        )
     )
     if not account:
         raise HTTPException(status_code=400, detail="Account not found")
 
-    # Generate transaction ID
-    import uuid
-
-    transaction_id = f"txn_{uuid.uuid4().hex[:12]}"
-
-    db_transaction = Transaction(
-        transaction_id=transaction_id,
-        user_id=current_user.id,
+    values = {
+        "transaction_id": generate_transaction_id(),
+        "user_id": current_user.id,
+        "environment": environment,
         **transaction.model_dump(),
-    )
+    }
+    if db.get_bind().dialect.insert_returning:
+        # INSERT ... RETURNING hands back the new row without a refresh SELECT
+        stmt = (
+            insert(Transaction)
+            .values(**values)
+            .returning(Transaction)
+            .options(selectinload(Transaction.category))
+        )
+        db_transaction = (await db.scalars(stmt)).one()
+        await db.commit()
+        return db_transaction
+
+    # MySQL has no INSERT ... RETURNING, so reload the row after inserting
+    db_transaction = Transaction(**values)
     db.add(db_transaction)
-    db.commit()
-    db.refresh(db_transaction)
+    await db.commit()
+    await db.refresh(db_transaction, attribute_names=["category"])
     return db_transaction
 
 
+@router.post("/bulk", response_model=list[TransactionResponse], status_code=201)
+async def bulk_create_transactions(
+    transactions: list[TransactionCreate] = Body(
+        ..., min_length=1, max_length=MAX_BULK_TRANSACTIONS
+    ),
+    current_user: User = Depends(get_current_user),
+    environment: str = Depends(get_current_environment),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[Transaction]:
+    """
+    Create many transactions in a single INSERT and commit.
+
+    Args:
+        transactions: Transactions to create
+        current_user: Current authenticated user
+        environment: Current Plaid environment (stamped on every row)
+        db: Async database session
+
+    Returns:
+        Created transactions, in request order
+    """
+    # Validate every referenced account exists and belongs to user (one query)
+    account_ids = {transaction.account_id for transaction in transactions}
+    owned_account_ids = set(
+        await db.scalars(
+            select(Account.id).where(
+                Account.id.in_(account_ids), Account.user_id == current_user.id
+            )
+        )
+    )
+    if account_ids - owned_account_ids:
+        raise HTTPException(status_code=400, detail="Account not found")
+
+    values = [
+        {
+            "transaction_id": generate_transaction_id(),
+            "user_id": current_user.id,
+            "environment": environment,
+            **transaction.model_dump(),
+        }
+        for transaction in transactions
+    ]
+    if db.get_bind().dialect.insert_returning:
+        stmt = (
+            insert(Transaction)
+            .returning(Transaction, sort_by_parameter_order=True)
+            .options(selectinload(Transaction.category))
+        )
+        db_transactions = list(await db.scalars(stmt, values))
+        await db.commit()
+        return db_transactions
+
+    # MySQL has no INSERT ... RETURNING: insert through the unit of work (one
+    # commit, keys read back from lastrowid) and load the categories in one
+    # IN query
+    db_transactions = [Transaction(**row) for row in values]
+    db.add_all(db_transactions)
+    await db.commit()
+    await db.scalars(
+        select(Transaction)
+        .where(Transaction.id.in_([transaction.id for transaction in db_transactions]))
+        .options(selectinload(Transaction.category))
+        .execution_options(populate_existing=True)
+    )
+    return db_transactions
+
+
 @router.patch("/{transaction_id}", response_model=TransactionResponse)
-def update_transaction(
+async def update_transaction(
     transaction_id: int,
     transaction: TransactionUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    environment: str = Depends(get_current_environment),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Transaction:
     """
     Update a transaction in the current environment.
@@ -181,40 +331,57 @@ def update_transaction(
         transaction_id: Transaction ID
         transaction: Updated transaction data
         current_user: Current authenticated user
-        db: Database session
+        environment: Current Plaid environment
+        db: Async database session
 
     Returns:
         Updated transaction
     """
-    # Get current environment from settings
-    settings = get_or_create_settings(db)
-
-    db_transaction = (
-        db.query(Transaction)
-        .filter(
+    update_data = transaction.model_dump(exclude_unset=True)
+    if not update_data:
+        db_transaction = await db.get(
+            Transaction, transaction_id, options=[selectinload(Transaction.category)]
+        )
+        if not is_visible(db_transaction, current_user, environment):
+            raise HTTPException(status_code=404, detail="Transaction not found")
+        return db_transaction
+
+    # Single UPDATE ... RETURNING instead of SELECT + UPDATE; a missing row
+    # (or one outside the user's environment) comes back as None
+    stmt = (
+        update(Transaction)
+        .where(
             Transaction.id == transaction_id,
             Transaction.user_id == current_user.id,
-            Transaction.environment == settings.plaid_environment,
+            Transaction.environment == environment,
         )
-        .first()
+        .values(**update_data)
     )
+    if db.get_bind().dialect.update_returning:
+        stmt = stmt.returning(Transaction).options(selectinload(Transaction.category))
+        db_transaction = (await db.scalars(stmt)).one_or_none()
+    else:
+        # MySQL has no UPDATE ... RETURNING, so reload the row after updating
+        result = await db.execute(stmt)
+        db_transaction = (
+            await db.get(Transaction, transaction_id, options=[selectinload(Transaction.category)])
+            if result.rowcount
+            else None
+        )
     if not db_transaction:
+        await db.rollback()
         raise HTTPException(status_code=404, detail="Transaction not found")
 
-    update_data = transaction.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_transaction, field, value)
-
-    db.commit()
-    db.refresh(db_transaction)
+    await db.commit()
     return db_transaction
 
 
 @router.delete("/{transaction_id}", status_code=204)
-def delete_transaction(
+async def delete_transaction(
     transaction_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    environment: str = Depends(get_current_environment),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
     """
     Delete a transaction in the current environment.
@@ -222,22 +389,12 @@ def delete_transaction(
     Args:
         transaction_id: Transaction ID
         current_user: Current authenticated user
-        db: Database session
+        environment: Current Plaid environment
+        db: Async database session
     """
-    # Get current environment from settings
-    settings = get_or_create_settings(db)
-
-    db_transaction = (
-        db.query(Transaction)
-        .filter(
-            Transaction.id == transaction_id,
-            Transaction.user_id == current_user.id,
-            Transaction.environment == settings.plaid_environment,
-        )
-        .first()
-    )
-    if not db_transaction:
+    db_transaction = await db.get(Transaction, transaction_id)
+    if not is_visible(db_transaction, current_user, environment):
         raise HTTPException(status_code=404, detail="Transaction not found")
 
-    db.delete(db_transaction)
-    db.commit()
+    await db.delete(db_transaction)
+    await db.commit()
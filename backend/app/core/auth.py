@@ -3,15 +3,16 @@
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.database import get_db, set_current_user_for_rls
+from app.core.database import get_db, set_current_environment_for_rls, set_current_user_for_rls
 from app.models.user import User
+from app.services.settings_service import get_settings_snapshot
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -149,6 +150,32 @@ def get_current_admin_user(current_user: User = Depends(get_current_user)) -> Us
     return current_user
 
 
+def get_current_environment(request: Request, db: Session = Depends(get_db)) -> str:
+    """
+    Get the active Plaid environment ('sandbox' or 'production').
+
+    Read from the cached settings snapshot and memoized on request.state, so
+    the settings row is queried at most once per cache TTL rather than once
+    per request.
+
+    Args:
+        request: Incoming request (used to memoize the environment)
+        db: Database session (only used on a settings cache miss)
+
+    Returns:
+        Current Plaid environment
+    """
+    environment: str | None = getattr(request.state, "environment", None)
+    if environment is None:
+        environment = get_settings_snapshot(db).plaid_environment
+        request.state.environment = environment
+
+    # Set environment context for Row-Level Security (PostgreSQL only)
+    set_current_environment_for_rls(environment)
+
+    return environment
+
+
 def authenticate_user(db: Session, email: str, password: str) -> User | None:
     """
     Authenticate a user by email and password.
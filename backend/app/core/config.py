@@ -1,5 +1,6 @@
 """Application configuration."""
 
+from functools import cached_property, lru_cache
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -27,6 +28,16 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./data/mintbean.db"
+    # Connection pool sizing (PostgreSQL/MySQL only, ignored for SQLite)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_USE_LIFO: bool = True
+    DB_POOL_PRE_PING: bool = True
+    # Create missing tables at startup; turn off once the schema is managed
+    # by migrations so worker boots skip the per-table existence checks
+    DB_CREATE_ALL: bool = True
 
     # Encryption (for sensitive data like Plaid access tokens)
     ENCRYPTION_KEY: str = ""
@@ -43,12 +54,41 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
 
-    @property
-    def BACKEND_CORS_ORIGINS(self) -> list[str]:
-        """Parse CORS origins from comma-separated string or wildcard."""
+    # Rate limiting: counters live in this process by default; point at
+    # redis://host:6379 to share them across workers (needs the redis package)
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+
+    # Error tracking (optional, disabled when SENTRY_DSN is empty)
+    SENTRY_DSN: str = ""
+    SENTRY_ENVIRONMENT: str = "development"
+    SENTRY_TRACES_SAMPLE_RATE: float = 0.1
+    SENTRY_PROFILES_SAMPLE_RATE: float = 0.1
+    APP_VERSION: str = "0.1.0"
+
+    @cached_property
+    def BACKEND_CORS_ORIGINS(self) -> tuple[str, ...]:
+        """Parse CORS origins from comma-separated string or wildcard (parsed once)."""
         if self.ALLOWED_ORIGINS == "*":
-            return ["*"]
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip()]
+            return ("*",)
+        return tuple(origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip())
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings.
+
+    Settings are read from the environment and .env on first use and then
+    reused, so importing this module doesn't pay for parsing and validation.
+
+    Returns:
+        Application settings
+    """
+    return Settings()
 
 
-settings = Settings()
+def __getattr__(name: str) -> Settings:
+    """Build the module-level ``settings`` lazily on first access (PEP 562)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
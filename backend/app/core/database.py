@@ -2,10 +2,15 @@
 
 from collections.abc import Generator
 from contextvars import ContextVar
+from typing import Any
 
-from sqlalchemy import create_engine, event, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import URL, Connection, DateTime, Engine, create_engine, event, make_url, text
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, Session, SessionTransaction, sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.core.config import settings
 
@@ -28,20 +33,58 @@ def get_database_url() -> str:
     return settings.DATABASE_URL
 
 
-def create_db_engine(database_url: str | None = None):
+# Applied to every new SQLite connection: WAL lets readers run alongside a
+# writer, and synchronous=NORMAL (safe with WAL) avoids an fsync per commit
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+# Connections kept open per SQLite engine
+SQLITE_POOL_SIZE = 5
+
+
+def is_sqlite_file(url: URL) -> bool:
+    """Check whether a SQLite URL points at a database file (not :memory: or mode=memory)."""
+    return bool(url.database) and url.database != ":memory:" and url.query.get("mode") != "memory"
+
+
+def set_sqlite_pragmas(
+    dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry
+) -> None:
+    """
+    Configure a new SQLite connection (engine "connect" event handler).
+
+    Args:
+        dbapi_connection: Raw DBAPI connection
+        connection_record: Pool connection record (unused)
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def create_db_engine(database_url: str | None = None) -> Engine:
     """
     Create a SQLAlchemy engine with optimized connection pooling.
 
     Connection Pool Configuration:
-    - PostgreSQL/MySQL: QueuePool with 5-20 connections, max overflow 10
-    - SQLite: NullPool (no pooling, SQLite is file-based)
+    - PostgreSQL/MySQL: QueuePool with 5 connections, max overflow 10
+    - SQLite: small QueuePool for database files, WAL mode via SQLITE_PRAGMAS
 
     Pool Settings:
     - pool_size: Number of permanent connections (default: 5)
     - max_overflow: Additional connections when pool exhausted (default: 10)
     - pool_timeout: Seconds to wait for connection (default: 30)
-    - pool_recycle: Recycle connections after 1 hour (prevents stale connections)
-    - pool_pre_ping: Test connection before using (ensures valid connections)
+    - pool_recycle: Recycle connections after 30 minutes (prevents stale connections)
+    - pool_pre_ping: Test connection before using (default: on, DB_POOL_PRE_PING)
+    - pool_use_lifo: Hand out the most recently used connection first (default: on)
 
     Args:
         database_url: Optional database URL. If not provided, uses get_database_url()
@@ -49,56 +92,137 @@ def create_db_engine(database_url: str | None = None):
     Returns:
         SQLAlchemy engine with optimized pooling
     """
-    import os
-
-    url = database_url or get_database_url()
-    connect_args = {}
-    engine_kwargs = {"echo": settings.DEBUG}
+    url = make_url(database_url or get_database_url())
+    connect_args: dict[str, Any] = {}
+    engine_kwargs: dict[str, Any] = {"echo": settings.DEBUG}
 
     # SQLite-specific configuration
-    if "sqlite" in url:
+    if url.get_backend_name() == "sqlite":
         connect_args["check_same_thread"] = False
-        # Use NullPool for SQLite (no connection pooling needed)
-        from sqlalchemy.pool import NullPool
-
-        engine_kwargs["poolclass"] = NullPool
+        if is_sqlite_file(url):
+            # Keep a few connections open between requests instead of reopening
+            # the file (and re-running SQLITE_PRAGMAS) every time. One shared
+            # connection (StaticPool) would interleave concurrent sessions.
+            engine_kwargs.update(
+                {"poolclass": QueuePool, "pool_size": SQLITE_POOL_SIZE, "max_overflow": 10}
+            )
     else:
         # PostgreSQL/MySQL production configuration
-        # Pool size: number of permanent connections to maintain
-        pool_size = int(os.getenv("DB_POOL_SIZE", "5"))
-        # Max overflow: additional connections beyond pool_size
-        max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
-        # Pool timeout: seconds to wait for a connection
-        pool_timeout = int(os.getenv("DB_POOL_TIMEOUT", "30"))
-        # Pool recycle: recycle connections after this many seconds (prevents stale connections)
-        pool_recycle = int(os.getenv("DB_POOL_RECYCLE", "3600"))  # 1 hour
-
+        # Pool sizing comes from settings (DB_POOL_* environment variables)
         engine_kwargs.update(
             {
-                "pool_size": pool_size,
-                "max_overflow": max_overflow,
-                "pool_timeout": pool_timeout,
-                "pool_recycle": pool_recycle,
-                # Pre-ping: test connection before using (small overhead, ensures valid connections)
-                "pool_pre_ping": True,
+                # Pool size: number of permanent connections to maintain
+                "pool_size": settings.DB_POOL_SIZE,
+                # Max overflow: additional connections beyond pool_size
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                # Pool timeout: seconds to wait for a connection
+                "pool_timeout": settings.DB_POOL_TIMEOUT,
+                # Pool recycle: recycle connections after this many seconds (prevents stale connections)
+                "pool_recycle": settings.DB_POOL_RECYCLE,
+                # Pre-ping: test connection before using (small overhead, ensures valid connections).
+                # psycopg2 rejects an empty query client-side, so the sync engine pings with
+                # SELECT 1; set DB_POOL_PRE_PING=false to skip the ping entirely
+                "pool_pre_ping": settings.DB_POOL_PRE_PING,
+                # LIFO: reuse the most recently returned connection, so bursts are served
+                # by a few warm connections and surplus ones can idle out
+                # (see "Using FIFO vs. LIFO" in SQLAlchemy's pooling docs)
+                "pool_use_lifo": settings.DB_POOL_USE_LIFO,
             }
         )
 
-    return create_engine(url, connect_args=connect_args, **engine_kwargs)
+    db_engine = create_engine(url, connect_args=connect_args, **engine_kwargs)
+    if url.get_backend_name() == "sqlite":
+        event.listen(db_engine, "connect", set_sqlite_pragmas)
+    return db_engine
 
 
 # Create SQLAlchemy engine using bootstrap DATABASE_URL
 engine = create_db_engine()
 
+
+class RLSSession(Session):
+    """Session that applies the Row-Level Security context (see set_rls_context)."""
+
+
+def session_class_for(db_engine: Engine) -> type[Session]:
+    """
+    Pick the session class for an engine.
+
+    Only PostgreSQL has RLS, so only its sessions carry the after_begin hook;
+    SQLite and MySQL sessions don't pay for it at all.
+
+    Args:
+        db_engine: Engine the sessions will be bound to
+
+    Returns:
+        RLSSession for PostgreSQL, plain Session otherwise
+    """
+    return RLSSession if db_engine.dialect.name == "postgresql" else Session
+
+
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    class_=session_class_for(engine), autocommit=False, autoflush=False, bind=engine
+)
+
+
+class Base(DeclarativeBase):
+    """Base class for ORM models."""
+
+
+class utcnow(FunctionElement):  # noqa: N801
+    """
+    Current UTC time as a naive timestamp, evaluated by the database.
+
+    Used as a column default so INSERT/UPDATE statements render the clock
+    inline instead of calling datetime.now() in Python and binding the
+    result. Rendered per dialect so the value is UTC whatever the session
+    time zone is.
+    """
 
-# Create Base class for models
-Base = declarative_base()
+    type = DateTime()
+    inherit_cache = True
 
 
-@event.listens_for(Session, "after_begin")
-def set_rls_context(session, transaction, connection):
+@compiles(utcnow)
+def compile_utcnow(element: utcnow, compiler: SQLCompiler, **kw: Any) -> str:
+    """Render utcnow() for databases whose CURRENT_TIMESTAMP is already UTC."""
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def compile_utcnow_postgresql(element: utcnow, compiler: SQLCompiler, **kw: Any) -> str:
+    """Render utcnow() for PostgreSQL, converting from the session time zone."""
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "mysql")
+def compile_utcnow_mysql(element: utcnow, compiler: SQLCompiler, **kw: Any) -> str:
+    """Render utcnow() for MySQL, with microseconds."""
+    return "UTC_TIMESTAMP(6)"
+
+
+@compiles(utcnow, "sqlite")
+def compile_utcnow_sqlite(element: utcnow, compiler: SQLCompiler, **kw: Any) -> str:
+    """Render utcnow() for SQLite, with milliseconds (CURRENT_TIMESTAMP has none)."""
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+# Transaction-local (is_local=true, like SET LOCAL) RLS settings. Built once with
+# bound parameters, so values are never interpolated into SQL and the statement
+# text is identical on every transaction.
+SET_RLS_USER_ID = text("SELECT set_config('app.current_user_id', :value, true)")
+SET_RLS_ENVIRONMENT = text("SELECT set_config('app.current_environment', :value, true)")
+SET_RLS_USER_ID_AND_ENVIRONMENT = text(
+    "SELECT set_config('app.current_user_id', :user_id, true),"
+    " set_config('app.current_environment', :environment, true)"
+)
+
+
+@event.listens_for(RLSSession, "after_begin")
+def set_rls_context(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
     """
     Set PostgreSQL session variables for Row-Level Security.
 
@@ -106,23 +230,23 @@ def set_rls_context(session, transaction, connection):
     current user ID and environment in PostgreSQL session variables.
     RLS policies use these variables to filter rows.
 
-    Only runs on PostgreSQL (silently skips for SQLite).
+    Only registered on RLSSession, which session_class_for() picks for
+    PostgreSQL engines only.
     """
-    # Only set RLS context for PostgreSQL
-    if "postgresql" not in str(connection.engine.url):
-        return
-
     user_id = current_user_id.get()
     environment = current_environment.get()
 
     try:
-        # Set user context for RLS policies
-        if user_id is not None:
-            session.execute(text(f"SET LOCAL app.current_user_id = '{user_id}'"))
-
-        # Set environment context for RLS policies
-        if environment is not None:
-            session.execute(text(f"SET LOCAL app.current_environment = '{environment}'"))
+        # Set user and environment context for RLS policies in one round trip
+        if user_id is not None and environment is not None:
+            connection.execute(
+                SET_RLS_USER_ID_AND_ENVIRONMENT,
+                {"user_id": str(user_id), "environment": environment},
+            )
+        elif user_id is not None:
+            connection.execute(SET_RLS_USER_ID, {"value": str(user_id)})
+        elif environment is not None:
+            connection.execute(SET_RLS_ENVIRONMENT, {"value": environment})
     except Exception:
         # Silently ignore errors (e.g., if RLS is not enabled yet)
         pass
@@ -0,0 +1,120 @@
+"""Async database engine and session management."""
+
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.core.database import (
+    SQLITE_POOL_SIZE,
+    get_database_url,
+    is_sqlite_file,
+    session_class_for,
+    set_sqlite_pragmas,
+)
+
+# Async DBAPI driver used for each database backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+    "sqlite": "aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str | None = None) -> str:
+    """
+    Get the async variant of a database URL.
+
+    Swaps the sync driver (psycopg2, pymysql, pysqlite) for its async
+    counterpart, e.g. postgresql://... -> postgresql+asyncpg://...
+
+    Args:
+        database_url: Optional sync database URL. If not provided, uses get_database_url()
+
+    Returns:
+        Database URL string using an async driver
+    """
+    url = make_url(database_url or get_database_url())
+    backend = url.get_backend_name()
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+def create_async_db_engine(database_url: str | None = None) -> AsyncEngine:
+    """
+    Create an async SQLAlchemy engine.
+
+    Uses the same DB_POOL_* settings as create_db_engine() so both engines
+    are sized consistently.
+
+    Args:
+        database_url: Optional sync database URL. If not provided, uses get_database_url()
+
+    Returns:
+        SQLAlchemy AsyncEngine
+    """
+    url = make_url(get_async_database_url(database_url))
+    is_sqlite = url.get_backend_name() == "sqlite"
+    engine_kwargs: dict[str, Any] = {"echo": settings.DEBUG}
+
+    if is_sqlite:
+        if is_sqlite_file(url):
+            # Same small pool as the sync engine
+            engine_kwargs.update(
+                {
+                    "poolclass": AsyncAdaptedQueuePool,
+                    "pool_size": SQLITE_POOL_SIZE,
+                    "max_overflow": 10,
+                }
+            )
+    else:
+        engine_kwargs.update(
+            {
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_timeout": settings.DB_POOL_TIMEOUT,
+                "pool_recycle": settings.DB_POOL_RECYCLE,
+                # asyncpg pings with an empty query (";"), which skips the planner
+                "pool_pre_ping": settings.DB_POOL_PRE_PING,
+                "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+            }
+        )
+
+    db_engine = create_async_engine(url, **engine_kwargs)
+    if is_sqlite:
+        event.listen(db_engine.sync_engine, "connect", set_sqlite_pragmas)
+    return db_engine
+
+
+# Create async SQLAlchemy engine using bootstrap DATABASE_URL
+async_engine = create_async_db_engine()
+
+# Instances stay loaded after commit so responses can be serialized without
+# lazy loads (which aren't possible outside the async context)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    sync_session_class=session_class_for(async_engine.sync_engine),
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get async database session.
+
+    Yields:
+        Async database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
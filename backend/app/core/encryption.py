@@ -19,14 +19,37 @@ Usage:
     decrypted = decrypt_value(encrypted)
 """
 
+import base64
 import os
+from functools import lru_cache
 
-from cryptography.fernet import Fernet
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from app.core.config import settings
+
+# Prefix marking values written by encrypt_value_v2() (AES-256-GCM)
+V2_PREFIX = "v2:"
+
+# AES-GCM nonce size in bytes (96 bits, as recommended for GCM)
+V2_NONCE_SIZE = 12
+
+# Leading characters of stored encrypted values (Fernet tokens, v2 values)
+ENCRYPTED_PREFIXES = ("gAAAAA", V2_PREFIX)
+ENCRYPTED_PREFIXES_BYTES = tuple(prefix.encode() for prefix in ENCRYPTED_PREFIXES)
+ENCRYPTED_PREFIX_MAX_LENGTH = max(len(prefix) for prefix in ENCRYPTED_PREFIXES)
+
+# Errors raised by corrupt, tampered or wrongly keyed ciphertexts (ValueError
+# covers malformed base64 and non-UTF-8 plaintext); reported as ValueError
+DECRYPTION_ERRORS = (InvalidToken, InvalidTag, ValueError)
 
 
 def get_encryption_key() -> bytes:
     """
-    Get the encryption key from environment variable.
+    Get the encryption key from settings (ENCRYPTION_KEY environment variable).
 
     The key should be a 32-byte URL-safe base64-encoded string.
     You can generate a new key with: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
@@ -37,22 +60,23 @@ def get_encryption_key() -> bytes:
     Raises:
         ValueError: If ENCRYPTION_KEY is not set or invalid
     """
-    key = os.getenv("ENCRYPTION_KEY")
+    key = settings.ENCRYPTION_KEY
     if not key:
         raise ValueError(
             "ENCRYPTION_KEY environment variable not set. "
             'Generate one with: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"'
         )
 
-    try:
-        return key.encode()
-    except Exception as e:
-        raise ValueError(f"Invalid ENCRYPTION_KEY format: {e}") from e
+    return key.encode()
 
 
+@lru_cache(maxsize=1)
 def get_fernet() -> Fernet:
     """
-    Get a Fernet cipher instance.
+    Get the Fernet cipher instance.
+
+    Built once on first use and reused, so ENCRYPTION_KEY is read and the
+    key is decoded only once. Call reset_fernet_cache() after changing the key.
 
     Returns:
         Fernet cipher configured with the encryption key
@@ -60,6 +84,28 @@ def get_fernet() -> Fernet:
     return Fernet(get_encryption_key())
 
 
+@lru_cache(maxsize=1)
+def get_aesgcm() -> AESGCM:
+    """
+    Get the AES-GCM cipher used by the v2 format.
+
+    The 256-bit AES key is derived from ENCRYPTION_KEY with HKDF, so the same
+    configured key serves both formats without reusing key material directly.
+    Built once on first use, like get_fernet().
+
+    Returns:
+        AESGCM cipher configured with the derived key
+    """
+    hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b"mintbean-aesgcm-v2")
+    return AESGCM(hkdf.derive(base64.urlsafe_b64decode(get_encryption_key())))
+
+
+def reset_fernet_cache() -> None:
+    """Drop the cached ciphers so the next call re-reads ENCRYPTION_KEY."""
+    get_fernet.cache_clear()
+    get_aesgcm.cache_clear()
+
+
 def encrypt_value(plaintext: str | None) -> str | None:
     """
     Encrypt a string value.
@@ -70,50 +116,144 @@ def encrypt_value(plaintext: str | None) -> str | None:
     Returns:
         Encrypted value as a string (or None if input was None)
     """
-    if plaintext is None:
-        return None
+    if not plaintext:  # None or empty string
+        return plaintext
 
-    if not plaintext:  # Empty string
-        return ""
-
-    try:
-        fernet = get_fernet()
-        encrypted_bytes = fernet.encrypt(plaintext.encode())
-        return encrypted_bytes.decode()
-    except Exception as e:
-        raise ValueError(f"Encryption failed: {e}") from e
+    return get_fernet().encrypt(plaintext.encode()).decode()
 
 
 def decrypt_value(ciphertext: str | None) -> str | None:
     """
     Decrypt an encrypted string value.
 
+    Accepts both Fernet tokens and values written by encrypt_value_v2().
+
+    Args:
+        ciphertext: The encrypted value (or None)
+
+    Returns:
+        Decrypted plaintext string (or None if input was None)
+    """
+    if not ciphertext:  # None or empty string
+        return ciphertext
+
+    if ciphertext.startswith(V2_PREFIX):
+        return decrypt_value_v2(ciphertext)
+
+    # Fetched outside the try so a missing ENCRYPTION_KEY isn't reported as a bad value
+    fernet = get_fernet()
+    try:
+        return fernet.decrypt(ciphertext.encode()).decode()
+    except DECRYPTION_ERRORS as e:
+        raise ValueError(f"Decryption failed: {e}") from e
+
+
+def encrypt_value_v2(plaintext: str | None) -> str | None:
+    """
+    Encrypt a string value with AES-256-GCM.
+
+    Cheaper than Fernet for short values (a single AEAD pass instead of
+    AES-CBC plus a separate HMAC). The result is "v2:" followed by the
+    URL-safe base64 of nonce + ciphertext + tag.
+
+    Args:
+        plaintext: The value to encrypt (or None)
+
+    Returns:
+        Encrypted value as a string (or None if input was None)
+    """
+    if not plaintext:  # None or empty string
+        return plaintext
+
+    nonce = os.urandom(V2_NONCE_SIZE)
+    encrypted_bytes = get_aesgcm().encrypt(nonce, plaintext.encode(), None)
+    return V2_PREFIX + base64.urlsafe_b64encode(nonce + encrypted_bytes).decode()
+
+
+def _decrypt_v2(aesgcm: AESGCM, ciphertext: str) -> str:
+    """Decrypt a "v2:"-prefixed value, letting any error propagate."""
+    payload = base64.urlsafe_b64decode(ciphertext[len(V2_PREFIX) :])
+    nonce, encrypted_bytes = payload[:V2_NONCE_SIZE], payload[V2_NONCE_SIZE:]
+    return aesgcm.decrypt(nonce, encrypted_bytes, None).decode()
+
+
+def decrypt_value_v2(ciphertext: str | None) -> str | None:
+    """
+    Decrypt a value produced by encrypt_value_v2().
+
     Args:
         ciphertext: The encrypted value (or None)
 
     Returns:
         Decrypted plaintext string (or None if input was None)
     """
-    if ciphertext is None:
-        return None
+    if not ciphertext:  # None or empty string
+        return ciphertext
+    if not ciphertext.startswith(V2_PREFIX):
+        raise ValueError("Decryption failed: not a v2 value")
+
+    aesgcm = get_aesgcm()
+    try:
+        return _decrypt_v2(aesgcm, ciphertext)
+    except DECRYPTION_ERRORS as e:
+        raise ValueError(f"Decryption failed: {e}") from e
 
-    if not ciphertext:  # Empty string
-        return ""
 
+def encrypt_many(values: list[str | None]) -> list[str | None]:
+    """
+    Encrypt a batch of string values.
+
+    Equivalent to calling encrypt_value() on each item, but fetches the
+    cipher once for the whole batch.
+
+    Args:
+        values: The values to encrypt (items may be None or empty)
+
+    Returns:
+        Encrypted values in the same order (None and "" are passed through)
+    """
+    encrypt = get_fernet().encrypt
+    return [encrypt(value.encode()).decode() if value else value for value in values]
+
+
+def decrypt_many(ciphertexts: list[str | None]) -> list[str | None]:
+    """
+    Decrypt a batch of encrypted string values.
+
+    Equivalent to calling decrypt_value() on each item, Fernet and v2 values
+    alike, but fetches the ciphers once for the whole batch.
+
+    Args:
+        ciphertexts: The encrypted values (items may be None or empty)
+
+    Returns:
+        Decrypted plaintext values in the same order (None and "" are passed through)
+    """
+    decrypt = get_fernet().decrypt
+    aesgcm = get_aesgcm()
     try:
-        fernet = get_fernet()
-        decrypted_bytes = fernet.decrypt(ciphertext.encode())
-        return decrypted_bytes.decode()
-    except Exception as e:
+        return [
+            (
+                _decrypt_v2(aesgcm, value)
+                if value.startswith(V2_PREFIX)
+                else decrypt(value.encode()).decode()
+            )
+            if value
+            else value
+            for value in ciphertexts
+        ]
+    except DECRYPTION_ERRORS as e:
         raise ValueError(f"Decryption failed: {e}") from e
 
 
-def is_encrypted(value: str | None) -> bool:
+def is_encrypted(value: str | bytes | bytearray | memoryview | None) -> bool:
     """
     Check if a value appears to be encrypted.
 
-    This is a heuristic check based on Fernet token format.
-    Fernet tokens start with "gAAAAA" (base64 of timestamp + padding).
+    This is a heuristic check based on the stored formats.
+    Fernet tokens start with "gAAAAA" (base64 of timestamp + padding);
+    v2 (AES-GCM) values start with "v2:". Raw bytes from the database driver
+    are checked as-is, without decoding.
 
     Args:
         value: The value to check
@@ -126,4 +266,8 @@ def is_encrypted(value: str | None) -> bool:
 
     # Fernet tokens are base64 and typically start with 'gAAAAA'
     # This is not foolproof but good enough for migration detection
-    return value.startswith("gAAAAA")
+    if isinstance(value, str):
+        return value.startswith(ENCRYPTED_PREFIXES)
+    if isinstance(value, memoryview):
+        value = value[:ENCRYPTED_PREFIX_MAX_LENGTH].tobytes()
+    return value.startswith(ENCRYPTED_PREFIXES_BYTES)
@@ -22,11 +22,48 @@ Example .env:
 """
 
 import logging
-import os
+from types import ModuleType
+from typing import Any
+
+from app.core.config import settings
+
+sentry_sdk: ModuleType | None
+try:
+    import sentry_sdk
+except ImportError:
+    sentry_sdk = None
 
 logger = logging.getLogger(__name__)
 
 
+# Cheap, high-frequency endpoints that aren't worth tracing
+UNTRACED_PATH_PREFIXES = ("/health", "/metrics")
+
+
+def sample_traces(sampling_context: dict[str, Any]) -> float:
+    """
+    Decide the trace sample rate for a transaction (Sentry traces_sampler).
+
+    Health checks and Prometheus scrapes are dropped, so their span overhead
+    isn't paid on every probe; other requests use SENTRY_TRACES_SAMPLE_RATE
+    and distributed traces follow the upstream sampling decision.
+
+    Args:
+        sampling_context: Context passed by the Sentry SDK
+
+    Returns:
+        Sample rate between 0.0 and 1.0
+    """
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        return float(parent_sampled)
+
+    path = (sampling_context.get("asgi_scope") or {}).get("path", "")
+    if path.startswith(UNTRACED_PATH_PREFIXES):
+        return 0.0
+    return settings.SENTRY_TRACES_SAMPLE_RATE
+
+
 def init_error_tracking() -> None:
     """
     Initialize error tracking if SENTRY_DSN is configured.
@@ -34,26 +71,29 @@ def init_error_tracking() -> None:
     This function is idempotent and safe to call multiple times.
     If SENTRY_DSN is not set, error tracking is silently disabled.
     """
-    sentry_dsn = os.getenv("SENTRY_DSN")
+    sentry_dsn = settings.SENTRY_DSN
 
     if not sentry_dsn:
         logger.info("Error tracking disabled (SENTRY_DSN not configured)")
         return
 
+    if sentry_sdk is None:
+        logger.warning("sentry-sdk not installed. Install with: pip install sentry-sdk[fastapi]")
+        return
+
     try:
-        import sentry_sdk
         from sentry_sdk.integrations.fastapi import FastApiIntegration
         from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
-        environment = os.getenv("SENTRY_ENVIRONMENT", "development")
-        traces_sample_rate = float(os.getenv("SENTRY_TRACES_SAMPLE_RATE", "0.1"))
-        profiles_sample_rate = float(os.getenv("SENTRY_PROFILES_SAMPLE_RATE", "0.1"))
+        environment = settings.SENTRY_ENVIRONMENT
+        traces_sample_rate = settings.SENTRY_TRACES_SAMPLE_RATE
+        profiles_sample_rate = settings.SENTRY_PROFILES_SAMPLE_RATE
 
         sentry_sdk.init(
             dsn=sentry_dsn,
             environment=environment,
-            # Performance monitoring
-            traces_sample_rate=traces_sample_rate,
+            # Performance monitoring (health checks and metrics scrapes are never traced)
+            traces_sampler=sample_traces,
             profiles_sample_rate=profiles_sample_rate,
             # Integrations
             integrations=[
@@ -64,7 +104,7 @@ def init_error_tracking() -> None:
                 SqlalchemyIntegration(),
             ],
             # Release tracking
-            release=os.getenv("APP_VERSION", "0.1.0"),
+            release=settings.APP_VERSION,
             # Additional configuration
             attach_stacktrace=True,
             send_default_pii=False,  # Don't send PII by default
@@ -79,8 +119,6 @@ def init_error_tracking() -> None:
             f"traces_sample_rate={traces_sample_rate})"
         )
 
-    except ImportError:
-        logger.warning("sentry-sdk not installed. Install with: pip install sentry-sdk[fastapi]")
     except Exception as e:
         logger.error(f"Failed to initialize error tracking: {e}")
 
@@ -93,19 +131,18 @@ def capture_exception(exception: Exception, context: dict | None = None) -> None
         exception: The exception to capture
         context: Optional context dictionary to attach to the event
     """
-    try:
-        import sentry_sdk
-
-        if context:
-            with sentry_sdk.push_scope() as scope:
-                for key, value in context.items():
-                    scope.set_context(key, value)
-                sentry_sdk.capture_exception(exception)
-        else:
-            sentry_sdk.capture_exception(exception)
-    except ImportError:
+    if sentry_sdk is None:
         # Sentry not installed, just log
         logger.error(f"Exception: {exception}", exc_info=True)
+        return
+
+    if context:
+        with sentry_sdk.push_scope() as scope:
+            for key, value in context.items():
+                scope.set_context(key, value)
+            sentry_sdk.capture_exception(exception)
+    else:
+        sentry_sdk.capture_exception(exception)
 
 
 def capture_message(message: str, level: str = "info", context: dict | None = None) -> None:
@@ -117,17 +154,16 @@ def capture_message(message: str, level: str = "info", context: dict | None = No
         level: Severity level (debug, info, warning, error, fatal)
         context: Optional context dictionary to attach to the event
     """
-    try:
-        import sentry_sdk
-
-        if context:
-            with sentry_sdk.push_scope() as scope:
-                for key, value in context.items():
-                    scope.set_context(key, value)
-                sentry_sdk.capture_message(message, level=level)
-        else:
-            sentry_sdk.capture_message(message, level=level)
-    except ImportError:
+    if sentry_sdk is None:
         # Sentry not installed, just log
         log_func = getattr(logger, level, logger.info)
         log_func(message)
+        return
+
+    if context:
+        with sentry_sdk.push_scope() as scope:
+            for key, value in context.items():
+                scope.set_context(key, value)
+            sentry_sdk.capture_message(message, level=level)
+    else:
+        sentry_sdk.capture_message(message, level=level)
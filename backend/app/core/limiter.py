@@ -3,6 +3,12 @@
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from app.core.config import settings
+
 # Initialize rate limiter
 # Default limit: 100 requests per minute
-limiter = Limiter(key_func=get_remote_address, default_limits=["100/minute"])
+limiter = Limiter(
+    key_func=get_remote_address,
+    default_limits=["100/minute"],
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+)
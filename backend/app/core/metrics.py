@@ -1,9 +1,15 @@
 """Prometheus metrics for application monitoring."""
 
+from functools import lru_cache
+
 from prometheus_client import Counter, Gauge, Histogram
 from sqlalchemy import Engine
+from sqlalchemy.pool import QueuePool
 
 # HTTP Metrics
+# The endpoint label is the matched route template (e.g.
+# /api/v1/accounts/{account_id}), never the raw path, so IDs don't each
+# become a time series
 http_requests_total = Counter(
     "http_requests_total",
     "Total HTTP requests",
@@ -16,12 +22,67 @@ http_request_duration_seconds = Histogram(
     ["method", "endpoint"],
 )
 
+# The route isn't known until the request has been routed, so in-flight
+# requests are only broken down by method
 http_requests_in_progress = Gauge(
     "http_requests_in_progress",
     "Number of HTTP requests currently being processed",
-    ["method", "endpoint"],
+    ["method"],
 )
 
+# Endpoint label for requests that matched no route (404s, scanners)
+UNMATCHED_ENDPOINT = "unmatched"
+
+# Bound label children cached per HTTP metric key, so the request path
+# skips labels() validation and lookup
+HTTP_LABEL_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=HTTP_LABEL_CACHE_SIZE)
+def http_requests_gauge(method: str) -> Gauge:
+    """
+    Get the in-progress gauge bound to a request method.
+
+    Args:
+        method: HTTP method
+
+    Returns:
+        In-progress gauge child
+    """
+    return http_requests_in_progress.labels(method=method)
+
+
+@lru_cache(maxsize=HTTP_LABEL_CACHE_SIZE)
+def http_duration_histogram(method: str, endpoint: str) -> Histogram:
+    """
+    Get the duration histogram bound to a request key.
+
+    Args:
+        method: HTTP method
+        endpoint: Route template
+
+    Returns:
+        Duration histogram child
+    """
+    return http_request_duration_seconds.labels(method=method, endpoint=endpoint)
+
+
+@lru_cache(maxsize=HTTP_LABEL_CACHE_SIZE)
+def http_requests_counter(method: str, endpoint: str, status: int) -> Counter:
+    """
+    Get the request counter bound to a request key and status.
+
+    Args:
+        method: HTTP method
+        endpoint: Route template
+        status: Response status code
+
+    Returns:
+        Request counter child
+    """
+    return http_requests_total.labels(method=method, endpoint=endpoint, status=status)
+
+
 # Database Metrics
 db_queries_total = Counter(
     "db_queries_total",
@@ -29,6 +90,13 @@ db_queries_total = Counter(
     ["operation"],  # select, insert, update, delete
 )
 
+# Children for the fixed operation labels, bound once at import (this also
+# exports each series at zero before its first increment)
+db_queries_select = db_queries_total.labels(operation="select")
+db_queries_insert = db_queries_total.labels(operation="insert")
+db_queries_update = db_queries_total.labels(operation="update")
+db_queries_delete = db_queries_total.labels(operation="delete")
+
 db_query_duration_seconds = Histogram(
     "db_query_duration_seconds",
     "Database query duration in seconds",
@@ -95,6 +163,9 @@ auth_attempts_total = Counter(
     ["result"],  # success, failure
 )
 
+auth_attempts_success = auth_attempts_total.labels(result="success")
+auth_attempts_failure = auth_attempts_total.labels(result="failure")
+
 auth_rate_limit_hits_total = Counter(
     "auth_rate_limit_hits_total",
     "Total number of rate limit hits on auth endpoints",
@@ -107,33 +178,30 @@ def update_pool_metrics(engine: Engine) -> None:
     Update database connection pool metrics from SQLAlchemy engine.
 
     This function collects current pool statistics and updates Prometheus gauges.
-    Should be called periodically (e.g., every 15 seconds) or on-demand.
+    Called periodically by the app lifespan task (every 15 seconds by default).
 
     Args:
         engine: SQLAlchemy engine with connection pool
     """
-    try:
-        pool = engine.pool
-
-        # Only update metrics if we have a real pool (not NullPool for SQLite)
-        if hasattr(pool, "size"):
-            # Pool size configuration
-            db_pool_size.set(pool.size())
-
-            # Checked out connections (currently in use)
-            if hasattr(pool, "checkedout"):
-                db_pool_checked_out.set(pool.checkedout())
-
-            # Overflow connections (beyond pool_size)
-            if hasattr(pool, "overflow"):
-                db_pool_overflow.set(pool.overflow())
-
-            # Checked in connections (available in pool)
-            # This is: size - checkedout (available connections)
-            if hasattr(pool, "checkedout"):
-                checked_in = pool.size() - pool.checkedout()
-                db_pool_checked_in.set(checked_in if checked_in >= 0 else 0)
-
-    except Exception:
-        # Silently ignore errors (pool might not support all attributes)
-        pass
+    pool = engine.pool
+
+    # Only QueuePool (and its async adapter) tracks size/overflow; NullPool,
+    # StaticPool and friends have nothing to report
+    if not isinstance(pool, QueuePool):
+        return
+
+    size = pool.size()
+    checked_out = pool.checkedout()
+
+    # Pool size configuration
+    db_pool_size.set(size)
+
+    # Checked out connections (currently in use)
+    db_pool_checked_out.set(checked_out)
+
+    # Overflow connections (beyond pool_size)
+    db_pool_overflow.set(pool.overflow())
+
+    # Checked in connections (available in pool)
+    # This is: size - checkedout (available connections)
+    db_pool_checked_in.set(max(size - checked_out, 0))
@@ -14,96 +14,114 @@ against common web vulnerabilities:
 These headers implement defense-in-depth security best practices.
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Content-Security-Policy
+# Restricts which resources can be loaded by the browser
+# This is a strict policy - adjust based on your frontend needs
+CSP_DIRECTIVES = (
+    "default-src 'self'",  # Only allow resources from same origin
+    "script-src 'self' 'unsafe-inline'",  # Allow inline scripts (needed for some frameworks)
+    "style-src 'self' 'unsafe-inline'",  # Allow inline styles
+    "img-src 'self' data: https:",  # Allow images from same origin, data URIs, and HTTPS
+    "font-src 'self' data:",  # Allow fonts from same origin and data URIs
+    "connect-src 'self'",  # Allow API calls to same origin only
+    "frame-ancestors 'none'",  # Prevent framing (redundant with X-Frame-Options)
+    "base-uri 'self'",  # Restrict <base> tag URLs
+    "form-action 'self'",  # Restrict form submission targets
+)
+CSP_VALUE = "; ".join(CSP_DIRECTIVES)
+
+# Permissions-Policy (formerly Feature-Policy)
+# Controls which browser features the page can use
+# Disables potentially dangerous features
+PERMISSIONS_DIRECTIVES = (
+    "geolocation=()",  # Disable geolocation
+    "microphone=()",  # Disable microphone
+    "camera=()",  # Disable camera
+    "payment=()",  # Disable payment APIs
+    "usb=()",  # Disable USB access
+    "magnetometer=()",  # Disable magnetometer
+    "accelerometer=()",  # Disable accelerometer
+    "gyroscope=()",  # Disable gyroscope
+)
+PERMISSIONS_VALUE = ", ".join(PERMISSIONS_DIRECTIVES)
+
+SECURITY_HEADERS = {
+    # HTTP Strict Transport Security (HSTS)
+    # Tells browsers to only use HTTPS for the next 1 year
+    # includeSubDomains: Apply to all subdomains
+    # preload: Allow inclusion in browser HSTS preload lists
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains; preload",
+    # X-Content-Type-Options
+    # Prevents browsers from MIME-sniffing responses
+    # Forces browser to respect the Content-Type header
+    "X-Content-Type-Options": "nosniff",
+    # X-Frame-Options
+    # Prevents the page from being loaded in an iframe
+    # Protects against clickjacking attacks
+    "X-Frame-Options": "DENY",
+    # X-XSS-Protection
+    # Enables browser's built-in XSS filter (legacy browsers)
+    # Modern browsers rely on CSP instead
+    "X-XSS-Protection": "1; mode=block",
+    "Content-Security-Policy": CSP_VALUE,
+    # Referrer-Policy
+    # Controls how much referrer information is sent with requests
+    # strict-origin-when-cross-origin: Send full URL for same-origin, origin only for cross-origin
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": PERMISSIONS_VALUE,
+}
+
+# X-Powered-By and Server header removal
+# Some frameworks add these headers - remove them to avoid disclosing tech stack
+STRIPPED_HEADERS = frozenset({b"x-powered-by", b"server"})
+
+# Raw ASGI header pairs, encoded once at import
+RAW_SECURITY_HEADERS = tuple(
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in SECURITY_HEADERS.items()
+)
+
+# Drop any copies set upstream so ours replace rather than duplicate them
+REPLACED_HEADERS = STRIPPED_HEADERS | {name for name, _ in RAW_SECURITY_HEADERS}
+
+
+class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to all HTTP responses.
 
     This middleware adds comprehensive security headers following OWASP
-    best practices for web application security.
+    best practices for web application security. It is a plain ASGI
+    middleware that rewrites the response start message, so it avoids the
+    per-request task group and stream that BaseHTTPMiddleware sets up.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Add security headers to the response.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware/handler in the chain
-
-        Returns:
-            Response with security headers added
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        response = await call_next(request)
-
-        # HTTP Strict Transport Security (HSTS)
-        # Tells browsers to only use HTTPS for the next 1 year
-        # includeSubDomains: Apply to all subdomains
-        # preload: Allow inclusion in browser HSTS preload lists
-        response.headers[
-            "Strict-Transport-Security"
-        ] = "max-age=31536000; includeSubDomains; preload"
-
-        # X-Content-Type-Options
-        # Prevents browsers from MIME-sniffing responses
-        # Forces browser to respect the Content-Type header
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # X-Frame-Options
-        # Prevents the page from being loaded in an iframe
-        # Protects against clickjacking attacks
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # X-XSS-Protection
-        # Enables browser's built-in XSS filter (legacy browsers)
-        # Modern browsers rely on CSP instead
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # Content-Security-Policy
-        # Restricts which resources can be loaded by the browser
-        # This is a strict policy - adjust based on your frontend needs
-        csp_directives = [
-            "default-src 'self'",  # Only allow resources from same origin
-            "script-src 'self' 'unsafe-inline'",  # Allow inline scripts (needed for some frameworks)
-            "style-src 'self' 'unsafe-inline'",  # Allow inline styles
-            "img-src 'self' data: https:",  # Allow images from same origin, data URIs, and HTTPS
-            "font-src 'self' data:",  # Allow fonts from same origin and data URIs
-            "connect-src 'self'",  # Allow API calls to same origin only
-            "frame-ancestors 'none'",  # Prevent framing (redundant with X-Frame-Options)
-            "base-uri 'self'",  # Restrict <base> tag URLs
-            "form-action 'self'",  # Restrict form submission targets
-        ]
-        response.headers["Content-Security-Policy"] = "; ".join(csp_directives)
-
-        # Referrer-Policy
-        # Controls how much referrer information is sent with requests
-        # strict-origin-when-cross-origin: Send full URL for same-origin, origin only for cross-origin
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-        # Permissions-Policy (formerly Feature-Policy)
-        # Controls which browser features the page can use
-        # Disables potentially dangerous features
-        permissions_directives = [
-            "geolocation=()",  # Disable geolocation
-            "microphone=()",  # Disable microphone
-            "camera=()",  # Disable camera
-            "payment=()",  # Disable payment APIs
-            "usb=()",  # Disable USB access
-            "magnetometer=()",  # Disable magnetometer
-            "accelerometer=()",  # Disable accelerometer
-            "gyroscope=()",  # Disable gyroscope
-        ]
-        response.headers["Permissions-Policy"] = ", ".join(permissions_directives)
-
-        # X-Powered-By and Server header removal
-        # Some frameworks add these headers - remove them to avoid disclosing tech stack
-        if "X-Powered-By" in response.headers:
-            del response.headers["X-Powered-By"]
-        if "Server" in response.headers:
-            del response.headers["Server"]
-
-        return response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", [])
+                    if name.lower() not in REPLACED_HEADERS
+                ]
+                headers.extend(RAW_SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
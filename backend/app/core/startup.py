@@ -4,6 +4,8 @@ import logging
 import os
 import sys
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,22 +31,24 @@ def validate_environment() -> None:
 
     missing_required = []
     warnings = []
-
-    # Check required variables
-    for var, description in required_vars.items():
-        value = os.getenv(var)
-        if not value:
+    configured = []
+
+    # Check required and optional variables in one pass over the environment
+    env = os.environ
+    for var, description, required in (
+        *((var, description, True) for var, description in required_vars.items()),
+        *((var, description, False) for var, description in optional_vars.items()),
+    ):
+        if env.get(var):
+            configured.append(var)
+        elif required:
             missing_required.append(f"  - {var}: {description}")
         else:
-            logger.info(f"✓ {var} is configured")
-
-    # Check optional variables
-    for var, description in optional_vars.items():
-        value = os.getenv(var)
-        if not value:
             warnings.append(f"  - {var}: {description} (using default)")
-        else:
-            logger.info(f"✓ {var} is configured")
+
+    if logger.isEnabledFor(logging.INFO):
+        for var in configured:
+            logger.info("✓ %s is configured", var)
 
     # Report results
     if missing_required:
@@ -71,17 +75,19 @@ def validate_encryption_key() -> None:
     """
     Validate that the encryption key is a valid Fernet key.
 
-    Exits with error code 1 if the key is invalid.
+    Exits with error code 1 if the key is invalid. The cipher is built through
+    the cached get_fernet(), so the instance validated here is the one the
+    application reuses rather than a throwaway.
     """
-    from cryptography.fernet import Fernet
+    from app.core.encryption import get_fernet
 
-    encryption_key = os.getenv("ENCRYPTION_KEY")
-    if not encryption_key:
+    # Same source get_fernet() reads, so the key checked is the key validated
+    if not settings.ENCRYPTION_KEY:
         return  # Already caught by validate_environment()
 
     try:
-        # Try to create a Fernet instance to validate the key
-        Fernet(encryption_key.encode())
+        # Build the shared Fernet instance to validate the key
+        get_fernet()
         logger.info("✓ Encryption key is valid")
     except Exception as e:
         logger.error("=" * 70)
@@ -102,7 +108,7 @@ def run_startup_checks() -> None:
     """
     Run all startup validation checks.
 
-    Call this function before starting the FastAPI application.
+    Called from the application lifespan, before any request is served.
     """
     logger.info("=" * 70)
     logger.info("Running startup validation checks...")
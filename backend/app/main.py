@@ -1,74 +1,150 @@
 """Main FastAPI application entry point."""
 
+import asyncio
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from prometheus_client import make_asgi_app
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from starlette.middleware.base import BaseHTTPMiddleware
+from sqlalchemy import text
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api.v1 import api_router
 from app.core.config import settings
 from app.core.database import Base, engine
-from app.core.error_tracking import init_error_tracking
+from app.core.database_async import async_engine
 from app.core.limiter import limiter
 from app.core.metrics import (
-    http_request_duration_seconds,
-    http_requests_in_progress,
-    http_requests_total,
+    UNMATCHED_ENDPOINT,
+    http_duration_histogram,
+    http_requests_counter,
+    http_requests_gauge,
     update_pool_metrics,
 )
 from app.core.security_headers import SecurityHeadersMiddleware
 from app.core.startup import run_startup_checks
 
-# Run startup validation checks
-run_startup_checks()
+# Connectivity probe for /health/ready, built once rather than per probe
+READINESS_QUERY = text("SELECT 1")
 
-# Initialize error tracking (optional, only if SENTRY_DSN is set)
-init_error_tracking()
+# Static endpoint bodies, serialized once. Each request still gets a fresh
+# Response: middleware such as CORS edits the header list in place.
+LIVENESS_BODY = orjson.dumps({"status": "alive", "version": "0.1.0"})
+HEALTH_BODY = orjson.dumps({"status": "healthy", "version": "0.1.0"})
+ROOT_BODY = orjson.dumps({"message": "MintBean API", "docs": "/api/docs", "version": "0.1.0"})
 
-# Create database tables if they don't exist (for SQLite/development)
-# For production with PostgreSQL, use Alembic migrations instead
-# checkfirst=True prevents errors when tables already exist
-Base.metadata.create_all(bind=engine, checkfirst=True)
+# Fixed /health/ready check results, shared across probes (never mutated)
+DATABASE_CHECK_HEALTHY = {"status": "healthy", "message": "Connected"}
+ENCRYPTION_CHECK_HEALTHY = {"status": "healthy", "message": "Key configured"}
+ENCRYPTION_CHECK_UNHEALTHY = {"status": "unhealthy", "message": "ENCRYPTION_KEY not set"}
 
+# Served by openapi_json below rather than FastAPI's built-in route
+OPENAPI_URL = "/api/openapi.json"
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect HTTP metrics for Prometheus."""
+# How often the pool gauges are refreshed (matches the default scrape interval)
+POOL_METRICS_INTERVAL_SECONDS = 15
 
-    async def dispatch(self, request: Request, call_next):
+
+async def refresh_pool_metrics() -> None:
+    """Refresh the connection pool gauges periodically, off the scrape path."""
+    while True:
+        update_pool_metrics(engine)
+        await asyncio.sleep(POOL_METRICS_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Validate the environment, then warm up and start background work before serving."""
+    # Only paid when actually serving: importing app.main (tests, tooling)
+    # skips the checks, never opens the database and never loads sentry_sdk
+    from app.core.error_tracking import init_error_tracking
+
+    # Run startup validation checks
+    run_startup_checks()
+
+    # Initialize error tracking (optional, only if SENTRY_DSN is set)
+    init_error_tracking()
+
+    # Create database tables if they don't exist (for SQLite/development)
+    # For production with PostgreSQL, use migrations and set DB_CREATE_ALL=false
+    # checkfirst=True prevents errors when tables already exist
+    if settings.DB_CREATE_ALL:
+        Base.metadata.create_all(bind=engine, checkfirst=True)
+
+    openapi_bytes()
+    pool_metrics_task = asyncio.create_task(refresh_pool_metrics())
+    try:
+        yield
+    finally:
+        pool_metrics_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await pool_metrics_task
+
+
+# Paths served without request metrics: /metrics itself (avoids recursion)
+# and the trivial liveness probes, which would otherwise dominate the rates.
+# /health/ready touches the database, so it stays measured.
+UNMETERED_PATHS = frozenset({"/metrics", "/health", "/health/live"})
+
+
+class MetricsMiddleware:
+    """Middleware to collect HTTP metrics for Prometheus.
+
+    A plain ASGI middleware: it wraps send to read the response status, so
+    requests don't pay for the task group and streams BaseHTTPMiddleware sets
+    up.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Track request metrics."""
-        # Skip metrics for /metrics endpoint to avoid recursion
-        if request.url.path == "/metrics":
-            # Update pool metrics before serving /metrics endpoint
-            update_pool_metrics(engine)
-            return await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        method = request.method
-        path = request.url.path
+        if scope["path"] in UNMETERED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
 
         # Track in-progress requests
-        http_requests_in_progress.labels(method=method, endpoint=path).inc()
+        in_progress = http_requests_gauge(method)
+        in_progress.inc()
+
+        # Reported if the app fails before sending a response
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
 
         # Track request duration
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            response = await call_next(request)
-            status = response.status_code
-        except Exception as e:
-            status = 500
-            raise e
+            await self.app(scope, receive, send_with_status)
         finally:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
-            # Record metrics
-            http_requests_total.labels(method=method, endpoint=path, status=status).inc()
-            http_request_duration_seconds.labels(method=method, endpoint=path).observe(duration)
-            http_requests_in_progress.labels(method=method, endpoint=path).dec()
+            # Label by route template; the router stores the matched route
+            # in the scope
+            endpoint = getattr(scope.get("route"), "path", UNMATCHED_ENDPOINT)
 
-        return response
+            # Record metrics
+            http_requests_counter(method, endpoint, status).inc()
+            http_duration_histogram(method, endpoint).observe(duration)
+            in_progress.dec()
 
 
 app = FastAPI(
@@ -135,9 +211,11 @@ Current version: v1 (prefix: `/api/v1`)
 All endpoints are versioned to ensure backward compatibility.
     """,
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json",
+    openapi_url=OPENAPI_URL,
     contact={
         "name": "MintBean",
         "url": "https://github.com/your-org/mintbean",
@@ -152,17 +230,27 @@ All endpoints are versioned to ensure backward compatibility.
     ],
 )
 
+# Drop FastAPI's built-in schema route, which re-serializes the cached dict on
+# every hit; openapi_json below serves it from pre-serialized bytes instead
+app.router.routes = [
+    route for route in app.router.routes if getattr(route, "path", None) != OPENAPI_URL
+]
+
 # Add rate limiter state and error handler
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Configure security headers middleware (first, so it applies to all responses)
+# Middleware added last runs first, so the stack is
+# CORS -> Metrics -> SecurityHeaders -> app. CORS answers preflight OPTIONS
+# requests before the other layers do any work.
+
+# Configure security headers middleware (innermost, wraps every app response)
 app.add_middleware(SecurityHeadersMiddleware)
 
-# Configure metrics middleware (before CORS so we track all requests)
+# Configure metrics middleware
 app.add_middleware(MetricsMiddleware)
 
-# Configure CORS
+# Configure CORS (outermost)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.BACKEND_CORS_ORIGINS,
@@ -204,9 +292,9 @@ app.include_router(api_router, prefix="/api/v1")
         }
     },
 )
-async def liveness_check() -> dict:
+async def liveness_check() -> Response:
     """Liveness probe - checks if the application is running."""
-    return {"status": "alive", "version": "0.1.0"}
+    return Response(content=LIVENESS_BODY, media_type="application/json")
 
 
 @app.get(
@@ -270,10 +358,6 @@ async def liveness_check() -> dict:
 )
 async def readiness_check() -> dict:
     """Readiness probe - checks if the application is ready to serve traffic."""
-    from sqlalchemy import text
-
-    from app.core.database import SessionLocal
-
     checks = {
         "status": "ready",
         "version": "0.1.0",
@@ -281,11 +365,11 @@ async def readiness_check() -> dict:
     }
 
     # Check database connectivity
+    # Ping over a bare async connection: no ORM session, no blocking the loop
     try:
-        db = SessionLocal()
-        db.execute(text("SELECT 1"))
-        db.close()
-        checks["checks"]["database"] = {"status": "healthy", "message": "Connected"}
+        async with async_engine.connect() as conn:
+            await conn.execute(READINESS_QUERY)
+        checks["checks"]["database"] = DATABASE_CHECK_HEALTHY
     except Exception as e:
         checks["status"] = "not_ready"
         checks["checks"]["database"] = {
@@ -294,35 +378,61 @@ async def readiness_check() -> dict:
         }
 
     # Check encryption key is configured
-    import os
-
-    if os.getenv("ENCRYPTION_KEY"):
-        checks["checks"]["encryption"] = {"status": "healthy", "message": "Key configured"}
+    if settings.ENCRYPTION_KEY:
+        checks["checks"]["encryption"] = ENCRYPTION_CHECK_HEALTHY
     else:
         checks["status"] = "not_ready"
-        checks["checks"]["encryption"] = {
-            "status": "unhealthy",
-            "message": "ENCRYPTION_KEY not set",
-        }
+        checks["checks"]["encryption"] = ENCRYPTION_CHECK_UNHEALTHY
 
     return checks
 
 
 @app.get("/health")
-async def health_check() -> dict:
+async def health_check() -> Response:
     """
     Legacy health check endpoint.
 
     Deprecated: Use /health/live for liveness and /health/ready for readiness.
     """
-    return {"status": "healthy", "version": "0.1.0"}
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
-async def root() -> dict:
+async def root() -> Response:
     """Root endpoint."""
-    return {
-        "message": "MintBean API",
-        "docs": "/api/docs",
-        "version": "0.1.0",
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
+
+
+@lru_cache(maxsize=1)
+def openapi_bytes() -> bytes:
+    """
+    Serialize the OpenAPI schema once.
+
+    app.openapi() builds the schema on first use and caches the dict on
+    app.openapi_schema, so internal callers reuse it too.
+
+    Returns:
+        The schema as JSON bytes
+    """
+    return orjson.dumps(app.openapi())
+
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi_json(request: Request) -> Response:
+    """
+    Serve the pre-serialized OpenAPI schema.
+
+    Like FastAPI's built-in route, a root_path the app is mounted under is
+    added to the schema's servers the first time it is seen; the schema is
+    then rebuilt and re-serialized once.
+    """
+    root_path = request.scope.get("root_path", "").rstrip("/")
+    if (
+        root_path
+        and app.root_path_in_servers
+        and root_path not in {server.get("url") for server in app.servers}
+    ):
+        app.servers.insert(0, {"url": root_path})
+        app.openapi_schema = None
+        openapi_bytes.cache_clear()
+    return Response(content=openapi_bytes(), media_type="application/json")
@@ -1,17 +1,33 @@
 """Account model."""
 
-from datetime import UTC, datetime
-
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
-from app.core.database import Base
+from app.core.database import Base, utcnow
+from app.models.money import Cents
 
 
 class Account(Base):
     """Account model representing financial accounts."""
 
     __tablename__ = "accounts"
+    __table_args__ = (
+        # Serves the account list: one user's accounts in an environment,
+        # optionally only the active ones
+        Index("ix_accounts_user_env_active", "user_id", "environment", "is_active"),
+        # Beancount account names only need to be unique within a user's ledger
+        UniqueConstraint("user_id", "beancount_account", name="uq_accounts_user_beancount"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -35,11 +51,11 @@ class Account(Base):
     environment = Column(String(20), nullable=False, default="sandbox", index=True)
 
     # Beancount mapping
-    beancount_account = Column(String(255), nullable=False, unique=True)
+    beancount_account = Column(String(255), nullable=False)
 
-    # Balances
-    current_balance = Column(Float, nullable=True)
-    available_balance = Column(Float, nullable=True)
+    # Balances, stored as integer cents (see migrate_balances_to_cents.py)
+    current_balance = Column(Cents, nullable=True)
+    available_balance = Column(Cents, nullable=True)
     currency = Column(String(10), default="USD", nullable=False)
 
     # Status
@@ -48,11 +64,11 @@ class Account(Base):
 
     # Timestamps
     last_synced_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
+    created_at = Column(DateTime, default=utcnow(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
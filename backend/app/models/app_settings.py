@@ -1,11 +1,10 @@
 """Application settings model for global configuration."""
 
-from datetime import UTC, datetime
-
 from sqlalchemy import Column, DateTime, Integer, String
 from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.core.database import Base, utcnow
 from app.core.encryption import decrypt_value, encrypt_value
 
 
@@ -27,15 +26,17 @@ class AppSettings(Base):
     database_port = Column(Integer, nullable=True, default=3306)  # MySQL only
     database_name = Column(String(255), nullable=True)  # MySQL only
     database_user = Column(String(255), nullable=True)  # MySQL only
-    _database_password = Column(
+    _database_password: Mapped[str | None] = mapped_column(
         "database_password", String(500), nullable=True
     )  # MySQL only - encrypted
     sqlite_path = Column(String(500), nullable=True, default="./data/mintbean.db")
 
     # Plaid settings - single client_id, separate secrets per environment
     plaid_client_id = Column(String(255), nullable=True)
-    _plaid_sandbox_secret = Column("plaid_sandbox_secret", String(500), nullable=True)  # Encrypted
-    _plaid_production_secret = Column(
+    _plaid_sandbox_secret: Mapped[str | None] = mapped_column(
+        "plaid_sandbox_secret", String(500), nullable=True
+    )  # Encrypted
+    _plaid_production_secret: Mapped[str | None] = mapped_column(
         "plaid_production_secret", String(500), nullable=True
     )  # Encrypted
     plaid_environment = Column(
@@ -48,8 +49,8 @@ class AppSettings(Base):
         """Get decrypted database password."""
         return decrypt_value(self._database_password)
 
-    @database_password.setter
-    def database_password(self, value: str | None):
+    @database_password.inplace.setter
+    def _database_password_setter(self, value: str | None) -> None:
         """Set database password (will be encrypted)."""
         self._database_password = encrypt_value(value)
 
@@ -59,8 +60,8 @@ class AppSettings(Base):
         """Get decrypted Plaid sandbox secret."""
         return decrypt_value(self._plaid_sandbox_secret)
 
-    @plaid_sandbox_secret.setter
-    def plaid_sandbox_secret(self, value: str | None):
+    @plaid_sandbox_secret.inplace.setter
+    def _plaid_sandbox_secret_setter(self, value: str | None) -> None:
         """Set Plaid sandbox secret (will be encrypted)."""
         self._plaid_sandbox_secret = encrypt_value(value)
 
@@ -70,17 +71,17 @@ class AppSettings(Base):
         """Get decrypted Plaid production secret."""
         return decrypt_value(self._plaid_production_secret)
 
-    @plaid_production_secret.setter
-    def plaid_production_secret(self, value: str | None):
+    @plaid_production_secret.inplace.setter
+    def _plaid_production_secret_setter(self, value: str | None) -> None:
         """Set Plaid production secret (will be encrypted)."""
         self._plaid_production_secret = encrypt_value(value)
 
     # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
+    created_at = Column(DateTime, default=utcnow(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
@@ -32,7 +32,8 @@ class Category(Base):
 
     # Hierarchy - FK relationship for true parent-child structure
     parent_id = Column(Integer, ForeignKey("categories.id"), nullable=True, index=True)
-    parent = relationship("Category", remote_side=[id], backref="children")
+    parent = relationship("Category", remote_side=[id], back_populates="children")
+    children = relationship("Category", back_populates="parent")
 
     # Beancount mapping
     beancount_account = Column(String(255), nullable=False)
@@ -30,4 +30,11 @@ class DashboardTab(Base):
 
     # Relationships
     user = relationship("User", back_populates="dashboard_tabs")
-    widgets = relationship("DashboardWidget", back_populates="tab", cascade="all, delete-orphan")
+    # Widgets come back in layout order (row, then column), so renderers and
+    # API consumers don't need to sort them
+    widgets = relationship(
+        "DashboardWidget",
+        back_populates="tab",
+        cascade="all, delete-orphan",
+        order_by="[DashboardWidget.grid_row, DashboardWidget.grid_col, DashboardWidget.id]",
+    )
@@ -0,0 +1,45 @@
+"""Column types for monetary amounts."""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import BigInteger
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+CENTS_PER_UNIT = 100
+
+
+class Cents(TypeDecorator):
+    """
+    Money stored as integer minor units (cents) in a BIGINT column.
+
+    Python code keeps working in float major units (dollars): values are
+    rounded half-up to whole cents on the way in and divided back out on the
+    way out. Because SUM() takes its argument's type, aggregates such as
+    ``func.sum(Account.current_balance)`` come back in dollars too, while the
+    database adds exact integers instead of doubles.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: float | None, dialect: Dialect) -> int | None:
+        """Convert a dollar amount to whole cents."""
+        if value is None:
+            return None
+        # Go through str() so 0.285 rounds to 29 cents, not 28
+        cents = Decimal(str(value)) * CENTS_PER_UNIT
+        return int(cents.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> float | None:
+        """Convert stored cents back to a dollar amount."""
+        if value is None:
+            return None
+        # SUM(bigint) comes back as Decimal on PostgreSQL and MySQL; callers
+        # mix these amounts with float transaction sums, so always hand out floats
+        return float(value) / CENTS_PER_UNIT
+
+    @property
+    def python_type(self) -> type:
+        """Amounts are exposed to Python as floats."""
+        return float
@@ -2,8 +2,25 @@
 
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    literal,
+    text,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.core.database import Base
 
@@ -12,6 +29,17 @@ class Transaction(Base):
     """Transaction model representing financial transactions."""
 
     __tablename__ = "transactions"
+    # Serves the transaction list: equality on user/environment, then a
+    # descending seek on (date, id) for ordering and keyset pagination
+    __table_args__ = (
+        Index(
+            "ix_transactions_user_env_date_id",
+            "user_id",
+            "environment",
+            text("date DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -86,6 +114,35 @@ class Transaction(Base):
         """
         return "!" if self.pending else "*"
 
+    @hybrid_property
+    def search_text(self) -> str:
+        """Description and payee combined, as matched by transaction search."""
+        return f"{self.description or ''} {self.payee or ''}"
+
+    @search_text.inplace.expression
+    @classmethod
+    def _search_text_expression(cls) -> ColumnElement[str]:
+        """SQL expression matching ix_transactions_search_trgm."""
+        # Constants are rendered inline (not as bind params) so the planner can
+        # match the query against the index expression
+        empty, space = literal("", literal_execute=True), literal(" ", literal_execute=True)
+        return func.coalesce(cls.description, empty) + space + func.coalesce(cls.payee, empty)
+
     def __repr__(self) -> str:
         """String representation of transaction."""
         return f"<Transaction {self.transaction_id}: {self.description} - ${self.amount}>"
+
+
+# Trigram index so substring search (ILIKE '%term%') on search_text can use an
+# index instead of a sequential scan. PostgreSQL only; needs the pg_trgm extension.
+event.listen(
+    Transaction.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+Index(
+    "ix_transactions_search_trgm",
+    Transaction.search_text.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
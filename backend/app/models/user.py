@@ -2,7 +2,7 @@
 
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -12,6 +12,18 @@ class User(Base):
     """User account model."""
 
     __tablename__ = "users"
+    # Partial index so "does an admin exist?" checks stop at the first admin row.
+    # The predicates match what User.is_admin.is_(True) compiles to on each
+    # dialect; SQLite only uses a partial index when the WHERE term matches.
+    # (MySQL has no partial indexes and builds a plain index instead)
+    __table_args__ = (
+        Index(
+            "ix_users_is_admin",
+            "is_admin",
+            postgresql_where=text("is_admin IS TRUE"),
+            sqlite_where=text("is_admin IS 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
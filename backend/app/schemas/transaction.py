@@ -77,3 +77,4 @@ class TransactionListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
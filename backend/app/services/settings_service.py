@@ -1,9 +1,64 @@
 """Settings service for global application configuration."""
 
+import time
+from dataclasses import dataclass
+from typing import cast
+
 from sqlalchemy.orm import Session
 
 from app.models.app_settings import AppSettings
 
+# Plaid environments accepted by update_plaid_settings
+VALID_PLAID_ENVIRONMENTS = frozenset({"sandbox", "production"})
+
+# How long a settings snapshot is served from memory before re-reading the row
+SETTINGS_CACHE_TTL_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """
+    Detached, read-only copy of the AppSettings row.
+
+    Safe to share across requests and sessions because it holds plain values
+    rather than an ORM instance bound to a particular session. Secrets are
+    stored pre-masked, so the decrypted values never live in the cache.
+    """
+
+    plaid_client_id: str | None
+    plaid_sandbox_secret_masked: str | None
+    plaid_production_secret_masked: str | None
+    plaid_environment: str
+    database_type: str
+    database_host: str | None
+    database_port: int | None
+    database_name: str | None
+    database_user: str | None
+    database_password_masked: str | None
+    sqlite_path: str | None
+
+
+# (expires_at, snapshot) for the process-wide settings cache
+_settings_cache: tuple[float, SettingsSnapshot] | None = None
+
+
+def mask_secret(secret: str | None, visible: int = 4) -> str | None:
+    """
+    Mask a secret for display.
+
+    Args:
+        secret: Secret to mask
+        visible: Number of characters to keep at each end
+
+    Returns:
+        Masked secret, or None if no secret is set
+    """
+    if not secret:
+        return None
+    if len(secret) > 8:
+        return f"{secret[:visible]}...{secret[-visible:]}"
+    return "****"
+
 
 def get_or_create_settings(db: Session) -> AppSettings:
     """
@@ -31,6 +86,52 @@ def get_or_create_settings(db: Session) -> AppSettings:
     return settings
 
 
+def get_settings_snapshot(db: Session) -> SettingsSnapshot:
+    """
+    Get a cached, detached snapshot of the global settings.
+
+    The snapshot is kept in process memory for SETTINGS_CACHE_TTL_SECONDS so
+    read-only callers don't hit the database on every request. Writers must
+    call invalidate_settings_cache() after committing changes.
+
+    Args:
+        db: Database session (only used on a cache miss)
+
+    Returns:
+        SettingsSnapshot of the current settings
+    """
+    global _settings_cache
+
+    now = time.monotonic()
+    if _settings_cache is not None and _settings_cache[0] > now:
+        return _settings_cache[1]
+
+    settings = get_or_create_settings(db)
+    # The model's legacy Column attributes type as Column[...] although the
+    # loaded instance holds plain values
+    snapshot = SettingsSnapshot(
+        plaid_client_id=cast(str | None, settings.plaid_client_id),
+        plaid_sandbox_secret_masked=mask_secret(settings.plaid_sandbox_secret),
+        plaid_production_secret_masked=mask_secret(settings.plaid_production_secret),
+        plaid_environment=cast(str, settings.plaid_environment),
+        database_type=cast(str, settings.database_type),
+        database_host=cast(str | None, settings.database_host),
+        database_port=cast(int | None, settings.database_port),
+        database_name=cast(str | None, settings.database_name),
+        database_user=cast(str | None, settings.database_user),
+        database_password_masked=mask_secret(settings.database_password, visible=2),
+        sqlite_path=cast(str | None, settings.sqlite_path),
+    )
+    _settings_cache = (now + SETTINGS_CACHE_TTL_SECONDS, snapshot)
+    return snapshot
+
+
+def invalidate_settings_cache() -> None:
+    """Drop the cached settings snapshot so the next read hits the database."""
+    global _settings_cache
+    _settings_cache = None
+
+
 def update_plaid_settings(
     db: Session,
     client_id: str | None = None,
@@ -65,11 +166,12 @@ def update_plaid_settings(
 
     # Update environment
     if environment is not None:
-        if environment not in ["sandbox", "production"]:
+        if environment not in VALID_PLAID_ENVIRONMENTS:
             raise ValueError("Environment must be 'sandbox' or 'production'")
         settings.plaid_environment = environment
 
     db.commit()
     db.refresh(settings)
+    invalidate_settings_cache()
 
     return settings
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Add the partial admin index to the users table.
+
+The setup status check asks "does any admin exist?"; ix_users_is_admin
+covers only admin rows (a plain index on MySQL, which has no partial
+indexes), so the EXISTS stops at the first one. Base.metadata.create_all()
+never adds indexes to tables that already exist, so existing databases need
+this script.
+
+An ix_users_is_admin created before its predicate was matched to
+User.is_admin.is_(True) is never used by SQLite, so an existing index is
+rebuilt rather than kept (the users table is small).
+
+Usage:
+    python migrate_add_admin_index.py
+
+The script will:
+1. Drop ix_users_is_admin if it exists
+2. Create it from the model definition
+
+Safe to re-run.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to the path
+sys.path.insert(0, str(Path(__file__).parent))  # noqa: E402
+
+from sqlalchemy import inspect  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+INDEX_NAME = "ix_users_is_admin"
+
+
+def main() -> int:
+    """Run the migration."""
+    print(f"\n=== Adding {INDEX_NAME} ({engine.dialect.name}) ===")
+
+    existing = {index["name"] for index in inspect(engine).get_indexes("users")}
+    index = next(index for index in User.__table__.indexes if index.name == INDEX_NAME)
+    try:
+        with engine.begin() as conn:
+            if INDEX_NAME in existing:
+                index.drop(conn)
+                print(f"  ✅ Dropped the existing {INDEX_NAME}")
+            index.create(conn)
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        return 1
+
+    print(f"  ✅ Created {INDEX_NAME}")
+    print("\n✅ Migration completed successfully!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
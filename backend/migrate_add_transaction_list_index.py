@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Add the keyset pagination index to the transactions table.
+
+Transaction listing filters on (user_id, environment) and orders by
+(date DESC, id DESC); ix_transactions_user_env_date_id serves both.
+Base.metadata.create_all() never adds indexes to tables that already exist,
+so existing databases need this script.
+
+Usage:
+    python migrate_add_transaction_list_index.py
+
+The script will:
+1. Check whether ix_transactions_user_env_date_id already exists
+2. Create it from the model definition if it is missing
+
+Safe to re-run.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to the path
+sys.path.insert(0, str(Path(__file__).parent))  # noqa: E402
+
+from sqlalchemy import inspect  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.models.transaction import Transaction  # noqa: E402
+
+INDEX_NAME = "ix_transactions_user_env_date_id"
+
+
+def main() -> int:
+    """Run the migration."""
+    print(f"\n=== Adding {INDEX_NAME} ({engine.dialect.name}) ===")
+
+    existing = {index["name"] for index in inspect(engine).get_indexes("transactions")}
+    if INDEX_NAME in existing:
+        print(f"✅ {INDEX_NAME} already exists, nothing to do")
+        return 0
+
+    index = next(index for index in Transaction.__table__.indexes if index.name == INDEX_NAME)
+    try:
+        index.create(engine)
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        return 1
+
+    print(f"  ✅ Created {INDEX_NAME}")
+    print("\n✅ Migration completed successfully!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Add the trigram search index to the transactions table (PostgreSQL only).
+
+Transaction search runs ILIKE '%term%' over description and payee;
+ix_transactions_search_trgm (a GIN pg_trgm index on that expression) lets
+PostgreSQL answer it without a sequential scan. Base.metadata.create_all()
+never adds indexes to tables that already exist, so existing databases need
+this script. SQLite and MySQL have no trigram index and are skipped.
+
+Usage:
+    python migrate_add_transaction_search_index.py
+
+The script will:
+1. Enable the pg_trgm extension if it isn't already
+2. Create ix_transactions_search_trgm from the model definition if it is missing
+
+Safe to re-run.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to the path
+sys.path.insert(0, str(Path(__file__).parent))  # noqa: E402
+
+from sqlalchemy import inspect, text  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.models.transaction import Transaction  # noqa: E402
+
+INDEX_NAME = "ix_transactions_search_trgm"
+
+
+def main() -> int:
+    """Run the migration."""
+    dialect = engine.dialect.name
+    print(f"\n=== Adding {INDEX_NAME} ({dialect}) ===")
+
+    if dialect != "postgresql":
+        print("✅ Trigram indexes are PostgreSQL only, nothing to do")
+        return 0
+
+    existing = {index["name"] for index in inspect(engine).get_indexes("transactions")}
+    if INDEX_NAME in existing:
+        print(f"✅ {INDEX_NAME} already exists, nothing to do")
+        return 0
+
+    index = next(index for index in Transaction.__table__.indexes if index.name == INDEX_NAME)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            print("  ✅ pg_trgm extension enabled")
+            index.create(conn)
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        return 1
+
+    print(f"  ✅ Created {INDEX_NAME}")
+    print("\n✅ Migration completed successfully!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
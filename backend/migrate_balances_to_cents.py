@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Convert account balances from floating point to integer cents.
+
+Account.current_balance and Account.available_balance are now BIGINT columns
+holding cents (see app/models/money.py). This script rewrites existing
+FLOAT/DOUBLE columns in place for SQLite, PostgreSQL and MySQL.
+
+Usage:
+    python migrate_balances_to_cents.py
+
+For each balance column that is still floating point, the script:
+1. Adds a temporary BIGINT column
+2. Copies the balance into it as cents, rounded in Python exactly like
+   Cents does for new writes (half-up), so every dialect agrees
+3. Drops the old column and renames the new one into its place
+
+Columns that are already integers are skipped, so the script is safe to re-run.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to the path
+sys.path.insert(0, str(Path(__file__).parent))  # noqa: E402
+
+from sqlalchemy import Float, inspect, text  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.models.money import Cents  # noqa: E402
+
+BALANCE_COLUMNS = ("current_balance", "available_balance")
+
+
+def float_balance_columns() -> list[str]:
+    """Return the balance columns that still store floating point values."""
+    columns = {column["name"]: column["type"] for column in inspect(engine).get_columns("accounts")}
+    return [name for name in BALANCE_COLUMNS if isinstance(columns.get(name), Float)]
+
+
+def convert_column(conn, name: str) -> None:
+    """Replace a floating point balance column with a BIGINT cents column."""
+    temp_name = f"{name}_cents"
+    conn.execute(text(f"ALTER TABLE accounts ADD COLUMN {temp_name} BIGINT"))
+    rows = conn.execute(text(f"SELECT id, {name} FROM accounts WHERE {name} IS NOT NULL")).all()
+    if rows:
+        to_cents = Cents().process_bind_param
+        conn.execute(
+            text(f"UPDATE accounts SET {temp_name} = :cents WHERE id = :id"),
+            [{"id": row.id, "cents": to_cents(row[1], engine.dialect)} for row in rows],
+        )
+    conn.execute(text(f"ALTER TABLE accounts DROP COLUMN {name}"))
+    conn.execute(text(f"ALTER TABLE accounts RENAME COLUMN {temp_name} TO {name}"))
+
+
+def main() -> int:
+    """Run the migration."""
+    print(f"\n=== Converting account balances to cents ({engine.dialect.name}) ===")
+
+    pending = float_balance_columns()
+    if not pending:
+        print("✅ Balances are already stored as cents, nothing to do")
+        return 0
+
+    try:
+        with engine.begin() as conn:
+            for name in pending:
+                convert_column(conn, name)
+                print(f"  ✅ Converted accounts.{name}")
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        return 1
+
+    print("\n✅ Migration completed successfully!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
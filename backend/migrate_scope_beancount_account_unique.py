@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Scope the beancount_account uniqueness on accounts to each user.
+
+accounts.beancount_account used to be globally unique. It is now unique per
+(user_id, beancount_account) via uq_accounts_user_beancount.
+
+Usage:
+    python migrate_scope_beancount_account_unique.py
+
+The script will:
+1. Add the uq_accounts_user_beancount unique constraint if it is missing
+2. Drop the old global unique constraint on beancount_account (PostgreSQL,
+   MySQL). SQLite can't drop a table's inline UNIQUE constraint without
+   rebuilding the table, so there the old, stricter constraint is kept
+
+Safe to re-run.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to the path
+sys.path.insert(0, str(Path(__file__).parent))  # noqa: E402
+
+from sqlalchemy import inspect, text  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+
+NEW_CONSTRAINT = "uq_accounts_user_beancount"
+
+
+def unique_constraints() -> dict[str, list[str]]:
+    """Return the unique constraints and indexes on accounts, by name."""
+    inspector = inspect(engine)
+    found = {
+        constraint["name"]: constraint["column_names"]
+        for constraint in inspector.get_unique_constraints("accounts")
+    }
+    found.update(
+        (index["name"], index["column_names"])
+        for index in inspector.get_indexes("accounts")
+        if index["unique"]
+    )
+    return found
+
+
+def main() -> int:
+    """Run the migration."""
+    dialect = engine.dialect.name
+    print(f"\n=== Scoping beancount_account uniqueness per user ({dialect}) ===")
+
+    constraints = unique_constraints()
+
+    try:
+        with engine.begin() as conn:
+            if NEW_CONSTRAINT in constraints:
+                print(f"✅ {NEW_CONSTRAINT} already exists")
+            elif dialect == "sqlite":
+                conn.execute(
+                    text(
+                        f"CREATE UNIQUE INDEX {NEW_CONSTRAINT} "
+                        "ON accounts (user_id, beancount_account)"
+                    )
+                )
+                print(f"  ✅ Created {NEW_CONSTRAINT}")
+            else:
+                conn.execute(
+                    text(
+                        f"ALTER TABLE accounts ADD CONSTRAINT {NEW_CONSTRAINT} "
+                        "UNIQUE (user_id, beancount_account)"
+                    )
+                )
+                print(f"  ✅ Created {NEW_CONSTRAINT}")
+
+            for name, columns in constraints.items():
+                if columns != ["beancount_account"]:
+                    continue
+                if dialect == "sqlite" or name is None:
+                    print("  ⚠️  Keeping the old global constraint (SQLite can't drop it in place)")
+                elif dialect == "mysql":
+                    conn.execute(text(f"ALTER TABLE accounts DROP INDEX {name}"))
+                    print(f"  ✅ Dropped {name}")
+                else:
+                    conn.execute(text(f"ALTER TABLE accounts DROP CONSTRAINT {name}"))
+                    print(f"  ✅ Dropped {name}")
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        return 1
+
+    print("\n✅ Migration completed successfully!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
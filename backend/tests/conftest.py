@@ -1,21 +1,35 @@
 """Pytest configuration and fixtures."""
 
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from datetime import datetime
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+
+# Use in-memory SQLite for tests. The database uses a shared cache so the async
+# engine (used by async endpoints) sees the same data as the sync engine; the
+# sync StaticPool connection keeps the database alive for the whole run.
+SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///file:mintbean_test?mode=memory&cache=shared&uri=true"
+SQLALCHEMY_ASYNC_TEST_DATABASE_URL = (
+    "sqlite+aiosqlite:///file:mintbean_test?mode=memory&cache=shared&uri=true"
+)
 
 # Set required environment variables for testing (before importing models)
 # These are test-only values - never use in production!
 os.environ.setdefault("ENCRYPTION_KEY", "GhPOXJpn8ALN8oF9LzcyqUe24gUZmL9lIMUeVKTtwhU=")
 os.environ.setdefault("SECRET_KEY", "test-secret-key-for-jwt-signing-do-not-use-in-production")
+# The app's own engines (health checks, startup work) use the test database
+# too, so test runs never open ./data/mintbean.db
+os.environ["DATABASE_URL"] = SQLALCHEMY_TEST_DATABASE_URL
 
+from app.api.v1.setup import invalidate_setup_status_cache  # noqa: E402
 from app.core.database import Base, get_db  # noqa: E402
+from app.core.database_async import get_async_db  # noqa: E402
 from app.main import app  # noqa: E402
 from app.models.account import Account  # noqa: E402
 from app.models.app_settings import AppSettings  # noqa: E402
@@ -23,9 +37,7 @@ from app.models.category import Category  # noqa: E402
 from app.models.plaid_item import PlaidItem  # noqa: E402
 from app.models.transaction import Transaction  # noqa: E402
 from app.models.user import User  # noqa: E402
-
-# Use in-memory SQLite for tests
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///:memory:"
+from app.services.settings_service import invalidate_settings_cache  # noqa: E402
 
 engine = create_engine(
     SQLALCHEMY_TEST_DATABASE_URL,
@@ -34,11 +46,16 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(SQLALCHEMY_ASYNC_TEST_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 @pytest.fixture(scope="function")
 def db() -> Generator[Session, None, None]:
     """Create a fresh database for each test."""
     Base.metadata.create_all(bind=engine)
+    invalidate_settings_cache()
+    invalidate_setup_status_cache()
     session = TestingSessionLocal()
 
     # Create default app settings for tests
@@ -70,7 +87,12 @@ def client(db: Session) -> Generator[TestClient, None, None]:
         finally:
             pass
 
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with TestingAsyncSessionLocal() as async_db:
+            yield async_db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
@@ -93,6 +115,32 @@ def test_user(db: Session) -> User:
     return user
 
 
+@pytest.fixture
+def admin_user(db: Session) -> User:
+    """Create a test admin user."""
+    from app.core.auth import get_password_hash
+
+    user = User(
+        email="admin@example.com",
+        hashed_password=get_password_hash("adminpassword"),
+        is_active=True,
+        is_admin=True,
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def admin_headers(admin_user: User) -> dict:
+    """Create authentication headers for admin user."""
+    from app.core.auth import create_access_token
+
+    token = create_access_token(data={"sub": str(admin_user.id)})
+    return {"Authorization": f"Bearer {token}"}
+
+
 @pytest.fixture
 def auth_headers(test_user: User) -> dict:
     """Create authentication headers for test user."""
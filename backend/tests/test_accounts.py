@@ -0,0 +1,162 @@
+"""Tests for account endpoints."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.account import Account
+from app.models.money import Cents
+from app.models.transaction import Transaction
+from app.models.user import User
+
+ACCOUNT_PAYLOAD = {
+    "name": "Savings",
+    "type": "depository",
+    "beancount_account": "Assets:Savings",
+}
+
+
+class TestAccountCrud:
+    """Test account create/update/delete endpoints."""
+
+    def test_create_and_update(self, client: TestClient, auth_headers: dict):
+        """Test an account can be created, fetched and renamed."""
+        response = client.post("/api/v1/accounts", json=ACCOUNT_PAYLOAD, headers=auth_headers)
+        assert response.status_code == 201
+        account = response.json()
+        assert account["account_id"].startswith("acc_")
+
+        response = client.patch(
+            f"/api/v1/accounts/{account['id']}", json={"name": "Rainy Day"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["name"] == "Rainy Day"
+
+        response = client.get(f"/api/v1/accounts/{account['id']}", headers=auth_headers)
+        assert response.json()["name"] == "Rainy Day"
+
+    def test_list_active_only(
+        self, client: TestClient, auth_headers: dict, db: Session, sample_account: Account
+    ):
+        """Test inactive accounts are hidden unless requested."""
+        sample_account.is_active = False
+        db.commit()
+
+        response = client.get("/api/v1/accounts", headers=auth_headers)
+        assert response.json() == []
+
+        response = client.get("/api/v1/accounts?active_only=false", headers=auth_headers)
+        assert len(response.json()) == 1
+
+    def test_delete_cascades_to_transactions(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        db: Session,
+        sample_transaction: Transaction,
+    ):
+        """Test deleting an account removes its transactions."""
+        account_id = sample_transaction.account_id
+        transaction_id = sample_transaction.id
+
+        response = client.delete(f"/api/v1/accounts/{account_id}", headers=auth_headers)
+        assert response.status_code == 204
+
+        db.expire_all()
+        assert db.get(Account, account_id) is None
+        assert db.get(Transaction, transaction_id) is None
+
+    def test_delete_not_found(self, client: TestClient, auth_headers: dict):
+        """Test deleting a missing account returns 404."""
+        response = client.delete("/api/v1/accounts/999", headers=auth_headers)
+        assert response.status_code == 404
+
+
+class TestAccountBalances:
+    """Test balances stored as integer cents."""
+
+    def test_balances_round_trip_as_cents(self, db: Session, sample_account: Account):
+        """Test dollar balances are stored as cents and read back as dollars."""
+        sample_account.current_balance = 1234.565
+        sample_account.available_balance = 0.285
+        db.commit()
+
+        stored = db.execute(
+            text("SELECT current_balance, available_balance FROM accounts WHERE id = :id"),
+            {"id": sample_account.id},
+        ).one()
+        assert tuple(stored) == (123457, 29)
+
+        db.expire_all()
+        assert sample_account.current_balance == 1234.57
+        assert sample_account.available_balance == 0.29
+
+    def test_sum_returns_dollars(self, db: Session, sample_account: Account):
+        """Test SUM over the cents column is converted back to dollars."""
+        sample_account.current_balance = 10.10
+        db.commit()
+
+        assert db.scalar(select(func.sum(Account.current_balance))) == 10.10
+
+    def test_decimal_sums_read_as_float(self):
+        """Test a Decimal SUM result (PostgreSQL, MySQL) is returned as a float."""
+        value = Cents().process_result_value(Decimal("1010"), postgresql.dialect())
+        assert value == 10.10
+        assert isinstance(value, float)
+
+
+class TestAccountTimestamps:
+    """Test timestamps filled in by the database."""
+
+    def test_created_and_updated_at_set_in_utc(self, db: Session, sample_account: Account):
+        """Test the SQL-side defaults produce current naive UTC timestamps."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+
+        assert abs(sample_account.created_at - now) < timedelta(minutes=1)
+        first_update = sample_account.updated_at
+
+        sample_account.name = "Renamed"
+        db.commit()
+
+        assert sample_account.updated_at >= first_update
+        assert abs(sample_account.updated_at - now) < timedelta(minutes=1)
+
+
+class TestBeancountAccountUniqueness:
+    """Test beancount_account is unique per user, not globally."""
+
+    def test_unique_per_user(self, db: Session, test_user: User, sample_account: Account):
+        """Test another user may reuse a name but the same user may not."""
+        other = User(email="other@example.com", hashed_password="x", is_active=True)
+        db.add(other)
+        db.commit()
+
+        db.add(
+            Account(
+                user_id=other.id,
+                account_id="other_acc_1",
+                name="Other Checking",
+                type="depository",
+                beancount_account=sample_account.beancount_account,
+            )
+        )
+        db.commit()
+
+        db.add(
+            Account(
+                user_id=test_user.id,
+                account_id="test_acc_2",
+                name="Duplicate",
+                type="depository",
+                beancount_account=sample_account.beancount_account,
+            )
+        )
+        with pytest.raises(IntegrityError):
+            db.commit()
+        db.rollback()
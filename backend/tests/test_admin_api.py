@@ -0,0 +1,87 @@
+"""Tests for admin user management endpoints."""
+
+from datetime import UTC, datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.account import Account
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.models.user import User
+
+
+class TestRestoreUser:
+    """Test POST /api/v1/admin/users/{user_id}/restore."""
+
+    def test_reset_loads_collections_in_bulk(
+        self, client: TestClient, admin_headers: dict, db: Session, test_user: User
+    ):
+        """Test a fresh-start restore deletes the data without per-row lazy loads."""
+        for i in range(3):
+            account = Account(
+                user_id=test_user.id,
+                account_id=f"acc_{i}",
+                name=f"Account {i}",
+                type="depository",
+                beancount_account=f"Assets:Checking:A{i}",
+                environment="sandbox",
+            )
+            category = Category(
+                user_id=test_user.id,
+                name=f"category_{i}",
+                display_name=f"Category {i}",
+                beancount_account=f"Expenses:C{i}",
+                category_type="expense",
+            )
+            db.add_all([account, category])
+            db.flush()
+            db.add(
+                Transaction(
+                    user_id=test_user.id,
+                    transaction_id=f"txn_{i}",
+                    account_id=account.id,
+                    category_id=category.id,
+                    date=datetime(2024, 3, 15),
+                    amount=-10.0,
+                    description="Test purchase",
+                    environment="sandbox",
+                )
+            )
+        test_user.archived_at = datetime.now(UTC)
+        test_user.is_active = False
+        db.commit()
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.post(
+                f"/api/v1/admin/users/{test_user.id}/restore",
+                headers=admin_headers,
+                json={"restore_data": False},
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert db.query(Account).filter(Account.user_id == test_user.id).count() == 0
+        assert db.query(Transaction).filter(Transaction.user_id == test_user.id).count() == 0
+        assert (
+            db.query(Category)
+            .filter(Category.user_id == test_user.id, Category.name.like("category_%"))
+            .count()
+            == 0
+        )
+        transaction_selects = [
+            statement
+            for statement in statements
+            if statement.startswith("SELECT") and "FROM transactions" in statement
+        ]
+        # User.transactions, Account.transactions and Category.transactions
+        assert len(transaction_selects) == 3
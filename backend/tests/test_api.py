@@ -1,6 +1,13 @@
 """Basic API tests."""
 
+from collections import Counter
+
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.main import app, openapi_bytes
+from app.models.category import Category
 
 
 def test_health_check(client: TestClient) -> None:
@@ -10,6 +17,21 @@ def test_health_check(client: TestClient) -> None:
     assert response.json()["status"] == "healthy"
 
 
+def test_liveness_check(client: TestClient) -> None:
+    """Test the pre-serialized liveness body is served as JSON."""
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "alive", "version": "0.1.0"}
+
+
+def test_readiness_check(client: TestClient) -> None:
+    """Test the readiness probe reaches the database."""
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["checks"]["database"]["status"] == "healthy"
+
+
 def test_root(client: TestClient) -> None:
     """Test root endpoint."""
     response = client.get("/")
@@ -17,6 +39,72 @@ def test_root(client: TestClient) -> None:
     assert "message" in response.json()
 
 
+def test_security_headers(client: TestClient) -> None:
+    """Test security headers are set once and the server header is stripped."""
+    response = client.get("/health")
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert response.headers["Strict-Transport-Security"].startswith("max-age=31536000")
+    assert "default-src 'self'" in response.headers["Content-Security-Policy"]
+    assert response.headers.get_list("X-Content-Type-Options") == ["nosniff"]
+    assert "server" not in response.headers
+
+
+def test_cors_preflight_answered_first(client: TestClient) -> None:
+    """Test CORS answers preflights before the other middleware runs."""
+    response = client.options(
+        "/api/v1/accounts",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "Authorization",
+        },
+    )
+    assert response.status_code == 200
+    # The preflight never reached the security headers middleware
+    assert "X-Frame-Options" not in response.headers
+
+
+def test_openapi_schema_served_from_bytes(client: TestClient) -> None:
+    """Test the OpenAPI schema is serialized once and served by a single route."""
+    first = client.get("/api/openapi.json")
+    second = client.get("/api/openapi.json")
+    assert first.status_code == 200
+    assert first.json()["info"]["title"] == "MintBean API"
+    assert first.content == second.content
+    assert openapi_bytes.cache_info().currsize == 1
+    schema_routes = [
+        route for route in app.routes if getattr(route, "path", None) == app.openapi_url
+    ]
+    assert len(schema_routes) == 1
+
+
+def test_openapi_schema_lists_root_path() -> None:
+    """Test a proxy root_path is added to the schema's servers, as FastAPI does."""
+    try:
+        with TestClient(app, root_path="/mintbean") as proxied:
+            response = proxied.get("/api/openapi.json")
+        assert response.status_code == 200
+        assert response.json()["servers"][0] == {"url": "/mintbean"}
+    finally:
+        app.servers[:] = [server for server in app.servers if server["url"] != "/mintbean"]
+        app.openapi_schema = None
+        openapi_bytes.cache_clear()
+
+
+def test_routes_registered_once() -> None:
+    """Test no method/path pair is registered by more than one router."""
+    routes = Counter(
+        (method, route.path)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    )
+    assert [key for key, count in routes.items() if count > 1] == []
+
+    transaction_routes = [key for key in routes if key[1].startswith("/api/v1/transactions")]
+    assert len(transaction_routes) == 6
+
+
 def test_list_transactions(client: TestClient, auth_headers: dict) -> None:
     """Test listing transactions."""
     response = client.get("/api/v1/transactions", headers=auth_headers)
@@ -38,6 +126,48 @@ def test_list_categories(client: TestClient, auth_headers: dict) -> None:
     assert isinstance(response.json(), list)
 
 
+def test_category_tree(
+    client: TestClient, auth_headers: dict, db: Session, sample_category: Category
+) -> None:
+    """Test the category tree nests children under their parent in display order."""
+    for name, order in (("organic", 2), ("bulk", 1)):
+        db.add(
+            Category(
+                user_id=sample_category.user_id,
+                name=name,
+                display_name=name.title(),
+                beancount_account=f"Expenses:Food:Groceries:{name.title()}",
+                category_type="expense",
+                parent_id=sample_category.id,
+                display_order=order,
+            )
+        )
+    db.commit()
+
+    response = client.get("/api/v1/categories/tree", headers=auth_headers)
+    assert response.status_code == 200
+    roots = [node for node in response.json() if node["id"] == sample_category.id]
+    assert len(roots) == 1
+    assert [child["name"] for child in roots[0]["children"]] == ["bulk", "organic"]
+    assert all(node["parent_id"] is None for node in response.json())
+
+
+def test_dashboard_tab_widgets_in_layout_order(client: TestClient, auth_headers: dict) -> None:
+    """Test a tab's widgets come back sorted by grid row, then column."""
+    tab = client.post("/api/v1/dashboards", headers=auth_headers, json={"name": "Main"}).json()
+    for title, row, col in (("c", 2, 1), ("b", 1, 2), ("a", 1, 1)):
+        response = client.post(
+            f"/api/v1/dashboards/{tab['id']}/widgets",
+            headers=auth_headers,
+            json={"widget_type": "summary_card", "title": title, "grid_row": row, "grid_col": col},
+        )
+        assert response.status_code == 201
+
+    response = client.get(f"/api/v1/dashboards/{tab['id']}", headers=auth_headers)
+    assert response.status_code == 200
+    assert [widget["title"] for widget in response.json()["widgets"]] == ["a", "b", "c"]
+
+
 def test_list_rules(client: TestClient, auth_headers: dict) -> None:
     """Test listing rules."""
     response = client.get("/api/v1/rules", headers=auth_headers)
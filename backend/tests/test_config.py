@@ -0,0 +1,34 @@
+"""Tests for application configuration."""
+
+import pytest
+
+from app.core import config
+
+
+def test_settings_is_shared_instance() -> None:
+    """Test the lazy module attribute and get_settings() return one cached instance."""
+    assert config.settings is config.get_settings()
+    assert config.get_settings() is config.get_settings()
+
+
+def test_unknown_module_attribute() -> None:
+    """Test the lazy __getattr__ only serves settings."""
+    with pytest.raises(AttributeError):
+        _ = config.not_a_setting
+
+
+def test_cors_origins_parsed_once() -> None:
+    """Test CORS origins are split and stripped once and cached as a tuple."""
+    settings = config.Settings(ALLOWED_ORIGINS=" http://a.test , ,http://b.test")
+
+    assert settings.BACKEND_CORS_ORIGINS == ("http://a.test", "http://b.test")
+    assert settings.BACKEND_CORS_ORIGINS is settings.BACKEND_CORS_ORIGINS
+    assert config.Settings(ALLOWED_ORIGINS="*").BACKEND_CORS_ORIGINS == ("*",)
+
+
+def test_rate_limit_storage_defaults_to_memory() -> None:
+    """Test the limiter uses the configured storage, in-process by default."""
+    from app.core.limiter import limiter
+
+    assert config.Settings().RATE_LIMIT_STORAGE_URI == "memory://"
+    assert type(limiter._storage).__name__ == "MemoryStorage"
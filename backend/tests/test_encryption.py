@@ -0,0 +1,128 @@
+"""Tests for encryption utilities."""
+
+import pytest
+from cryptography.fernet import Fernet
+
+from app.core.config import settings
+from app.core.encryption import (
+    decrypt_many,
+    decrypt_value,
+    decrypt_value_v2,
+    encrypt_many,
+    encrypt_value,
+    encrypt_value_v2,
+    get_fernet,
+    is_encrypted,
+    reset_fernet_cache,
+)
+
+
+class TestEncryption:
+    """Test encrypt_value() and decrypt_value()."""
+
+    def test_round_trip(self):
+        """Test a value decrypts back to the original plaintext."""
+        encrypted = encrypt_value("secret-value")
+
+        assert encrypted != "secret-value"
+        assert decrypt_value(encrypted) == "secret-value"
+
+    def test_empty_values_pass_through(self):
+        """Test None and empty strings are returned unchanged."""
+        assert encrypt_value(None) is None
+        assert encrypt_value("") == ""
+        assert decrypt_value(None) is None
+        assert decrypt_value("") == ""
+
+    def test_is_encrypted_accepts_bytes(self):
+        """Test raw driver values are recognised without decoding."""
+        encrypted = encrypt_value("secret-value").encode()
+        encrypted_v2 = encrypt_value_v2("secret-value").encode()
+
+        assert is_encrypted(encrypted)
+        assert is_encrypted(memoryview(encrypted_v2))
+        assert is_encrypted(bytearray(encrypted_v2))
+        assert not is_encrypted(b"plain")
+        assert not is_encrypted("plain")
+        assert not is_encrypted(b"")
+
+    def test_cipher_is_reused(self):
+        """Test the Fernet cipher is built once and shared between calls."""
+        assert get_fernet() is get_fernet()
+
+    def test_reset_picks_up_new_key(self, monkeypatch: pytest.MonkeyPatch):
+        """Test resetting the cache makes a rotated key take effect."""
+        encrypted = encrypt_value("secret-value")
+
+        monkeypatch.setattr(settings, "ENCRYPTION_KEY", Fernet.generate_key().decode())
+        reset_fernet_cache()
+        try:
+            with pytest.raises(ValueError, match="Decryption failed"):
+                decrypt_value(encrypted)
+        finally:
+            monkeypatch.undo()
+            reset_fernet_cache()
+
+        assert decrypt_value(encrypted) == "secret-value"
+
+    def test_missing_key_is_not_a_decryption_failure(self, monkeypatch: pytest.MonkeyPatch):
+        """Test a missing ENCRYPTION_KEY surfaces as such, not as a bad ciphertext."""
+        encrypted = encrypt_value("secret-value")
+
+        monkeypatch.setattr(settings, "ENCRYPTION_KEY", "")
+        reset_fernet_cache()
+        try:
+            with pytest.raises(ValueError, match="ENCRYPTION_KEY environment variable not set"):
+                decrypt_value(encrypted)
+        finally:
+            monkeypatch.undo()
+            reset_fernet_cache()
+
+
+class TestBatchEncryption:
+    """Test encrypt_many() and decrypt_many()."""
+
+    def test_round_trip_preserves_order_and_empty_values(self):
+        """Test a batch round-trips, passing None and empty strings through."""
+        values = ["first", None, "", "second"]
+
+        encrypted = encrypt_many(values)
+
+        assert encrypted[1] is None
+        assert encrypted[2] == ""
+        assert decrypt_value(encrypted[0]) == "first"
+        assert decrypt_many(encrypted) == values
+
+    def test_invalid_ciphertext(self):
+        """Test a bad item fails the batch with the same error as decrypt_value()."""
+        with pytest.raises(ValueError, match="Decryption failed"):
+            decrypt_many([encrypt_value("ok"), "not-a-token"])
+
+
+class TestEncryptionV2:
+    """Test the AES-GCM (v2) format."""
+
+    def test_round_trip(self):
+        """Test a v2 value decrypts back to the original plaintext."""
+        encrypted = encrypt_value_v2("secret-value")
+
+        assert encrypted.startswith("v2:")
+        assert encrypted != encrypt_value_v2("secret-value")  # fresh nonce each time
+        assert decrypt_value_v2(encrypted) == "secret-value"
+
+    def test_mixed_formats(self):
+        """Test the generic helpers read both Fernet and v2 values."""
+        v1, v2 = encrypt_value("one"), encrypt_value_v2("two")
+
+        assert is_encrypted(v1) and is_encrypted(v2)
+        assert decrypt_value(v2) == "two"
+        assert decrypt_many([v1, v2, None]) == ["one", "two", None]
+
+    def test_tampered_value(self):
+        """Test a modified v2 value fails authentication."""
+        encrypted = encrypt_value_v2("secret-value")
+        flipped = "A" if encrypted[10] != "A" else "B"
+        tampered = encrypted[:10] + flipped + encrypted[11:]
+
+        with pytest.raises(ValueError, match="Decryption failed"):
+            decrypt_value_v2(tampered)
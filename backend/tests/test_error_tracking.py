@@ -0,0 +1,23 @@
+"""Tests for error tracking configuration."""
+
+from app.core.config import settings
+from app.core.error_tracking import sample_traces
+
+
+class TestSampleTraces:
+    """Test the Sentry traces sampler."""
+
+    def test_health_and_metrics_not_traced(self):
+        """Test probe and scrape endpoints are never sampled."""
+        for path in ("/health", "/health/ready", "/metrics"):
+            assert sample_traces({"asgi_scope": {"path": path}}) == 0.0
+
+    def test_api_uses_configured_rate(self):
+        """Test regular requests use SENTRY_TRACES_SAMPLE_RATE."""
+        context = {"asgi_scope": {"path": "/api/v1/transactions"}}
+
+        assert sample_traces(context) == settings.SENTRY_TRACES_SAMPLE_RATE
+
+    def test_parent_decision_is_inherited(self):
+        """Test distributed traces follow the upstream sampling decision."""
+        assert sample_traces({"parent_sampled": True, "asgi_scope": {"path": "/health"}}) == 1.0
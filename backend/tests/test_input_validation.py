@@ -0,0 +1,137 @@
+"""Tests for input validation helpers."""
+
+import pytest
+
+from app.core.input_validation import (
+    allowed_chars_pattern,
+    sanitize_for_logging,
+    sanitize_html,
+    sanitize_string,
+    validate_alphanumeric,
+    validate_email_format,
+    validate_inputs,
+    validate_no_script_tags,
+    validate_no_special_chars,
+    validate_safe_filename,
+    validate_sql_safe,
+)
+
+
+class TestInputValidation:
+    """Test the regex-backed validators."""
+
+    @pytest.mark.parametrize(
+        "value",
+        ["1; DROP TABLE users --", "x' OR 1=1", "/* hidden */", "UNION SELECT password"],
+    )
+    def test_sql_patterns_rejected(self, value):
+        """Test common SQL injection payloads are rejected."""
+        with pytest.raises(ValueError, match="SQL"):
+            validate_sql_safe(value)
+
+    def test_sql_safe_value_passes(self):
+        """Test ordinary text passes the SQL check unchanged."""
+        assert validate_sql_safe("Coffee shop") == "Coffee shop"
+
+    @pytest.mark.parametrize(
+        "value",
+        ["<SCRIPT>alert(1)</script>", '<img onerror="x">', "JavaScript:alert(1)"],
+    )
+    def test_script_content_rejected(self, value):
+        """Test script tags, event handlers and javascript: URLs are rejected."""
+        with pytest.raises(ValueError):
+            validate_no_script_tags(value)
+
+    @pytest.mark.parametrize("filename", ["../etc/passwd", "/etc/passwd", "\\share", "C:file"])
+    def test_path_traversal_rejected(self, filename):
+        """Test each path traversal form is rejected."""
+        with pytest.raises(ValueError, match="path traversal"):
+            validate_safe_filename(filename)
+
+    def test_safe_filename(self):
+        """Test a plain filename is accepted and others with odd characters are not."""
+        assert validate_safe_filename("report_2024-01.csv") == "report_2024-01.csv"
+        with pytest.raises(ValueError, match="invalid characters"):
+            validate_safe_filename("report 2024.csv")
+        with pytest.raises(ValueError, match="invalid characters"):
+            validate_safe_filename("report.csv\n")
+
+    def test_email_format(self):
+        """Test emails are normalized and malformed ones rejected."""
+        assert validate_email_format("User@Example.com") == "user@example.com"
+        with pytest.raises(ValueError):
+            validate_email_format("not-an-email")
+        with pytest.raises(ValueError, match="maximum length"):
+            validate_email_format("a" * 250 + "@x.io")
+        with pytest.raises(ValueError, match="format"):
+            validate_email_format("\u212a@example.com")
+
+    def test_alphanumeric(self):
+        """Test spaces are only accepted when allowed."""
+        assert validate_alphanumeric("abc123") == "abc123"
+        assert validate_alphanumeric("abc 123", allow_spaces=True) == "abc 123"
+        with pytest.raises(ValueError):
+            validate_alphanumeric("abc 123")
+
+    def test_no_special_chars(self):
+        """Test extra allowed characters are honored, including regex metacharacters."""
+        assert validate_no_special_chars("a-b_c.d", allowed_chars="-_.") == "a-b_c.d"
+        assert validate_no_special_chars("a]b", allowed_chars="]") == "a]b"
+        with pytest.raises(ValueError):
+            validate_no_special_chars("a-b")
+
+    def test_sanitize_html(self):
+        """Test HTML special characters are escaped exactly once."""
+        assert (
+            sanitize_html("<a href='/x'>Tom & \"Jerry\"</a>")
+            == "&lt;a href=&#x27;&#x2F;x&#x27;&gt;Tom &amp; &quot;Jerry&quot;&lt;&#x2F;a&gt;"
+        )
+        assert sanitize_html("Coffee Shop 1234") == "Coffee Shop 1234"
+
+    def test_sanitize_for_logging(self):
+        """Test line breaks are flattened, null bytes dropped and output truncated."""
+        assert sanitize_for_logging("a\nb\r\x00c") == "a b c"
+        assert sanitize_for_logging("x" * 10, max_length=4) == "xxxx..."
+        assert sanitize_for_logging("ab\ncd\nef", max_length=4) == "ab c..."
+
+    def test_allowed_chars_pattern_cached(self):
+        """Test each allowed character set is compiled only once."""
+        assert allowed_chars_pattern("-_.") is allowed_chars_pattern("-_.")
+
+    def test_validate_inputs_decorator(self):
+        """Test decorated arguments are validated and unknown names are ignored."""
+
+        @validate_inputs(email=validate_email_format, missing=validate_alphanumeric)
+        def create_user(name: str, email: str | None = None) -> tuple[str, str | None]:
+            return name, email
+
+        assert create_user("ada", email="Ada@Example.com") == ("ada", "ada@example.com")
+        assert create_user("ada") == ("ada", None)
+        with pytest.raises(ValueError):
+            create_user("ada", "bad")
+
+    def test_validate_inputs_defaults_and_var_args(self):
+        """Test defaults are validated and *args parameters are passed as a tuple."""
+
+        @validate_inputs(email=validate_email_format)
+        def with_default(email: str = "Admin@Example.com") -> str:
+            return email
+
+        @validate_inputs(names=lambda names: tuple(n.upper() for n in names))
+        def shout(*names: str) -> tuple[str, ...]:
+            return names
+
+        assert with_default() == "admin@example.com"
+        assert with_default(email="B@Example.com") == "b@example.com"
+        assert shout("a", "b") == ("A", "B")
+        with pytest.raises(TypeError):
+            with_default("a@example.com", "extra")
+
+    def test_sanitize_string(self):
+        """Test null bytes are dropped, whitespace trimmed and length enforced."""
+        assert sanitize_string("  a\x00b  ") == "ab"
+        assert sanitize_string("clean") == "clean"
+        with pytest.raises(ValueError, match="maximum length"):
+            sanitize_string("x" * 11, max_length=10)
+        with pytest.raises(ValueError, match="maximum length"):
+            sanitize_string("x" * 10 + "\x00", max_length=10)
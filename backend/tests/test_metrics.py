@@ -0,0 +1,105 @@
+"""Tests for Prometheus metrics helpers."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app import main
+from app.core.database import create_db_engine
+from app.core.metrics import (
+    UNMATCHED_ENDPOINT,
+    auth_attempts_failure,
+    auth_attempts_total,
+    db_pool_checked_in,
+    db_pool_size,
+    db_queries_select,
+    db_queries_total,
+    http_duration_histogram,
+    http_requests_counter,
+    http_requests_gauge,
+    http_requests_total,
+    update_pool_metrics,
+)
+
+
+def test_update_pool_metrics_queue_pool(tmp_path) -> None:
+    """Test QueuePool statistics are copied into the gauges."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=3)
+    try:
+        with engine.connect():
+            update_pool_metrics(engine)
+            assert db_pool_size._value.get() == 3
+            assert db_pool_checked_in._value.get() == 2
+    finally:
+        engine.dispose()
+
+
+def test_update_pool_metrics_ignores_null_pool() -> None:
+    """Test pools without sizing information are skipped."""
+    engine = create_engine("sqlite://", poolclass=NullPool)
+    db_pool_size.set(-1)
+
+    update_pool_metrics(engine)
+
+    assert db_pool_size._value.get() == -1
+
+
+def test_http_label_children_cached() -> None:
+    """Test request metric children are bound once per label key."""
+    assert http_requests_gauge("GET") is http_requests_gauge("GET")
+    assert http_duration_histogram("GET", "/x") is http_duration_histogram("GET", "/x")
+    assert http_requests_counter("GET", "/x", 200) is http_requests_counter("GET", "/x", 200)
+
+    http_requests_counter("GET", "/x", 200).inc()
+    assert http_requests_total.labels(method="GET", endpoint="/x", status=200)._value.get() >= 1
+
+
+def test_fixed_label_children_prebound() -> None:
+    """Test fixed-label children are the same series labels() returns."""
+    assert db_queries_select is db_queries_total.labels(operation="select")
+    assert auth_attempts_failure is auth_attempts_total.labels(result="failure")
+
+
+def test_metrics_middleware_records_requests(client) -> None:
+    """Test the middleware counts requests with their response status."""
+    counter = http_requests_counter("GET", "/", 200)
+    before = counter._value.get()
+
+    assert client.get("/").status_code == 200
+
+    assert counter._value.get() == before + 1
+    assert http_requests_gauge("GET")._value.get() == 0
+
+
+def test_metrics_middleware_skips_probes(client) -> None:
+    """Test liveness probes aren't counted."""
+    counter = http_requests_counter("GET", "/health/live", 200)
+    before = counter._value.get()
+
+    assert client.get("/health/live").status_code == 200
+
+    assert counter._value.get() == before
+
+
+def test_metrics_middleware_labels_route_template(client, auth_headers) -> None:
+    """Test path parameters collapse into the route template label."""
+    template = "/api/v1/accounts/{account_id}"
+    counter = http_requests_counter("GET", template, 404)
+    before = counter._value.get()
+
+    client.get("/api/v1/accounts/98765", headers=auth_headers)
+    client.get("/api/v1/accounts/98766", headers=auth_headers)
+    client.get("/no/such/route")
+
+    assert counter._value.get() == before + 2
+    assert http_requests_counter("GET", UNMATCHED_ENDPOINT, 404)._value.get() >= 1
+
+
+def test_pool_metrics_refreshed_at_startup(tmp_path, monkeypatch) -> None:
+    """Test the lifespan task fills the pool gauges without a scrape."""
+    pooled_engine = create_db_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+    monkeypatch.setattr(main, "engine", pooled_engine)
+
+    with TestClient(main.app):
+        assert db_pool_size._value.get() == pooled_engine.pool.size()
+    pooled_engine.dispose()
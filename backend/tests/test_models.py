@@ -0,0 +1,14 @@
+"""Tests for the models package."""
+
+import app.models
+from app.core.database import Base
+
+
+def test_every_mapped_model_is_exported() -> None:
+    """Test app.models re-exports every mapped class, so importing it registers all tables."""
+    mapped = {mapper.class_.__name__ for mapper in Base.registry.mappers}
+
+    assert mapped <= set(app.models.__all__)
+    assert set(Base.metadata.tables) == {
+        mapper.class_.__tablename__ for mapper in Base.registry.mappers
+    }
@@ -0,0 +1,93 @@
+"""Tests for rule endpoints."""
+
+from fastapi.testclient import TestClient
+
+RULE_PAYLOAD = {
+    "name": "Coffee",
+    "conditions": {"field": "description", "operator": "contains", "value": "starbucks"},
+    "actions": {"set_payee": "Starbucks"},
+    "priority": 5,
+}
+
+
+def create_rule(client: TestClient, headers: dict) -> dict:
+    """Create a rule through the API and return its JSON."""
+    response = client.post("/api/v1/rules", headers=headers, json=RULE_PAYLOAD)
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestUpdateRule:
+    """Test PATCH /api/v1/rules/{id} endpoint."""
+
+    def test_update_partial(self, client: TestClient, auth_headers: dict):
+        """Test updating a subset of rule fields."""
+        rule = create_rule(client, auth_headers)
+
+        response = client.patch(
+            f"/api/v1/rules/{rule['id']}",
+            headers=auth_headers,
+            json={"priority": 10, "actions": {"set_payee": "Coffee Shop"}},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["priority"] == 10
+        assert data["actions"] == {"set_payee": "Coffee Shop"}
+        assert data["name"] == "Coffee"
+        assert data["conditions"] == RULE_PAYLOAD["conditions"]
+
+    def test_update_empty_body(self, client: TestClient, auth_headers: dict):
+        """Test an empty update leaves the rule unchanged."""
+        rule = create_rule(client, auth_headers)
+
+        response = client.patch(f"/api/v1/rules/{rule['id']}", headers=auth_headers, json={})
+
+        assert response.status_code == 200
+        assert response.json()["priority"] == 5
+
+    def test_update_not_found(self, client: TestClient, auth_headers: dict):
+        """Test updating a rule that doesn't exist."""
+        response = client.patch("/api/v1/rules/999", headers=auth_headers, json={"priority": 1})
+
+        assert response.status_code == 404
+
+    def test_update_other_users_rule(
+        self, client: TestClient, auth_headers: dict, admin_headers: dict
+    ):
+        """Test a user cannot update another user's rule."""
+        rule = create_rule(client, admin_headers)
+
+        response = client.patch(
+            f"/api/v1/rules/{rule['id']}", headers=auth_headers, json={"priority": 1}
+        )
+
+        assert response.status_code == 404
+        response = client.get(f"/api/v1/rules/{rule['id']}", headers=admin_headers)
+        assert response.json()["priority"] == 5
+
+
+class TestDeleteRule:
+    """Test DELETE /api/v1/rules/{id} endpoint."""
+
+    def test_delete(self, client: TestClient, auth_headers: dict):
+        """Test deleting a rule."""
+        rule = create_rule(client, auth_headers)
+
+        response = client.delete(f"/api/v1/rules/{rule['id']}", headers=auth_headers)
+
+        assert response.status_code == 204
+        response = client.get(f"/api/v1/rules/{rule['id']}", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_delete_other_users_rule(
+        self, client: TestClient, auth_headers: dict, admin_headers: dict
+    ):
+        """Test a user cannot delete another user's rule."""
+        rule = create_rule(client, admin_headers)
+
+        response = client.delete(f"/api/v1/rules/{rule['id']}", headers=auth_headers)
+
+        assert response.status_code == 404
+        response = client.get(f"/api/v1/rules/{rule['id']}", headers=admin_headers)
+        assert response.status_code == 200
@@ -0,0 +1,86 @@
+"""Tests for admin settings endpoints."""
+
+from fastapi.testclient import TestClient
+
+
+class TestPlaidSettings:
+    """Test GET/PUT /api/v1/settings/plaid endpoints."""
+
+    def test_get_requires_admin(self, client: TestClient, auth_headers: dict):
+        """Test non-admin users cannot read settings."""
+        response = client.get("/api/v1/settings/plaid", headers=auth_headers)
+
+        assert response.status_code == 403
+
+    def test_get_plaid_settings(self, client: TestClient, admin_headers: dict):
+        """Test reading Plaid settings."""
+        response = client.get("/api/v1/settings/plaid", headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["client_id"] == "test_client_id"
+        assert data["environment"] == "sandbox"
+        assert data["sandbox_secret_masked"] is None
+
+    def test_update_is_visible_to_cached_reads(self, client: TestClient, admin_headers: dict):
+        """Test a PUT invalidates the cached settings used by GET."""
+        client.get("/api/v1/settings/plaid", headers=admin_headers)
+
+        response = client.put(
+            "/api/v1/settings/plaid",
+            headers=admin_headers,
+            json={"sandbox_secret": "sandbox-secret-value", "environment": "production"},
+        )
+        assert response.status_code == 200
+
+        response = client.get("/api/v1/settings/plaid", headers=admin_headers)
+        data = response.json()
+        assert data["environment"] == "production"
+        assert data["sandbox_secret_masked"] == "sand...alue"
+
+    def test_invalid_environment_rejected(self, client: TestClient, admin_headers: dict):
+        """Test unknown Plaid environments fail request validation."""
+        response = client.put(
+            "/api/v1/settings/plaid",
+            headers=admin_headers,
+            json={"environment": "development"},
+        )
+
+        assert response.status_code == 422
+
+
+class TestDatabaseSettings:
+    """Test GET/PUT /api/v1/settings/database endpoints."""
+
+    def test_update_database_settings(self, client: TestClient, admin_headers: dict):
+        """Test updating MySQL settings masks the password."""
+        response = client.put(
+            "/api/v1/settings/database",
+            headers=admin_headers,
+            json={
+                "database_type": "mysql",
+                "database_host": "db.example.com",
+                "database_port": 3306,
+                "database_name": "mintbean",
+                "database_user": "mintbean",
+                "database_password": "supersecretpw",
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["database_host"] == "db.example.com"
+        assert data["database_password_masked"] == "su...pw"
+
+        response = client.get("/api/v1/settings/database", headers=admin_headers)
+        assert response.json()["database_type"] == "mysql"
+
+    def test_mysql_requires_credentials(self, client: TestClient, admin_headers: dict):
+        """Test MySQL settings without credentials are rejected."""
+        response = client.put(
+            "/api/v1/settings/database",
+            headers=admin_headers,
+            json={"database_type": "mysql", "database_host": "db.example.com"},
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,71 @@
+"""Tests for startup validation."""
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.core.config import settings
+from app.core.encryption import get_fernet
+from app.core.startup import validate_encryption_key, validate_environment
+from app.main import app
+
+
+def test_validate_environment_passes(monkeypatch, caplog) -> None:
+    """Test configured variables are logged and unset optional ones warned about."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "key")
+    monkeypatch.setenv("SECRET_KEY", "secret")
+    monkeypatch.delenv("POSTGRES_DB", raising=False)
+
+    with caplog.at_level(logging.INFO, logger="app.core.startup"):
+        validate_environment()
+
+    assert "✓ SECRET_KEY is configured" in caplog.messages
+    assert any("POSTGRES_DB" in message for message in caplog.messages)
+
+
+def test_validate_environment_missing_required(monkeypatch) -> None:
+    """Test a missing required variable stops startup."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "")
+    monkeypatch.setenv("SECRET_KEY", "secret")
+
+    with pytest.raises(SystemExit):
+        validate_environment()
+
+
+def test_validate_encryption_key_reuses_cipher() -> None:
+    """Test the validated cipher is the cached instance used for encryption."""
+    validate_encryption_key()
+
+    assert get_fernet.cache_info().currsize == 1
+    assert get_fernet() is get_fernet()
+
+
+def test_validate_encryption_key_reads_settings(monkeypatch) -> None:
+    """Test the presence check uses settings, not a stray environment variable."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "not-a-fernet-key")
+    monkeypatch.setattr(settings, "ENCRYPTION_KEY", "")
+
+    validate_encryption_key()  # Skipped (no exit): settings has no key
+
+
+def test_startup_checks_run_in_lifespan(caplog) -> None:
+    """Test startup checks run when the app starts serving."""
+    with caplog.at_level(logging.INFO, logger="app.core.startup"):
+        with TestClient(app):
+            pass
+    assert "Running startup validation checks..." in caplog.messages
+
+
+def test_tables_created_after_startup_checks(monkeypatch) -> None:
+    """Test the lifespan validates the environment before creating tables."""
+    calls = []
+    monkeypatch.setattr(main, "run_startup_checks", lambda: calls.append("checks"))
+    monkeypatch.setattr(
+        main.Base.metadata, "create_all", lambda **kwargs: calls.append("create_all")
+    )
+
+    with TestClient(app):
+        pass
+    assert calls == ["checks", "create_all"]
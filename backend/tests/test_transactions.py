@@ -2,13 +2,17 @@
 
 from datetime import datetime
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models.account import Account
+from app.models.app_settings import AppSettings
 from app.models.category import Category
 from app.models.transaction import Transaction
 from app.models.user import User
+from app.services.settings_service import invalidate_settings_cache
+from tests.conftest import async_engine
 
 
 class TestTransactionModel:
@@ -93,6 +97,36 @@ class TestListTransactions:
         assert response.status_code == 200
         data = response.json()
         assert len(data["transactions"]) == 5
+        assert data["total"] == 15
+        page_two = data["transactions"]
+
+        # Keyset pagination from the first page's cursor returns the same rows
+        response = client.get("/api/v1/transactions?page=1&page_size=10", headers=auth_headers)
+        cursor = response.json()["next_cursor"]
+        assert cursor is not None
+        response = client.get(
+            "/api/v1/transactions", params={"page_size": 10, "cursor": cursor}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [t["id"] for t in data["transactions"]] == [t["id"] for t in page_two]
+        assert data["total"] == 15
+        assert data["next_cursor"] is None
+
+        # Past the last page still reports the total
+        response = client.get("/api/v1/transactions?page=3&page_size=10", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["transactions"] == []
+        assert data["total"] == 15
+
+    def test_list_invalid_cursor(self, client: TestClient, auth_headers: dict):
+        """Test a malformed cursor is rejected."""
+        response = client.get(
+            "/api/v1/transactions", params={"cursor": "not-a-cursor"}, headers=auth_headers
+        )
+
+        assert response.status_code == 400
 
     def test_list_with_filters(
         self,
@@ -158,11 +192,29 @@ class TestListTransactions:
         assert response.status_code == 200
         assert response.json()["total"] == 1
 
+        # Test malformed dates are rejected before querying
+        response = client.get("/api/v1/transactions?start_date=March", headers=auth_headers)
+        assert response.status_code == 422
+
         # Test search
         response = client.get("/api/v1/transactions?search=coffee", headers=auth_headers)
         assert response.status_code == 200
         assert response.json()["total"] == 1
 
+        # Test search matches payee
+        response = client.get("/api/v1/transactions?search=STARBUCKS", headers=auth_headers)
+        assert response.json()["total"] == 1
+
+        # Test LIKE wildcards in search are matched literally
+        response = client.get("/api/v1/transactions?search=%25", headers=auth_headers)
+        assert response.json()["total"] == 0
+
+        # Test surrounding whitespace is ignored and a blank search is no filter
+        response = client.get("/api/v1/transactions?search=%20coffee%20", headers=auth_headers)
+        assert response.json()["total"] == 1
+        response = client.get("/api/v1/transactions?search=%20%20", headers=auth_headers)
+        assert response.json()["total"] == 2
+
 
 class TestGetTransaction:
     """Test GET /api/v1/transactions/{transaction_id} endpoint."""
@@ -229,6 +281,33 @@ class TestCreateTransaction:
         # Should fail due to foreign key constraint
         assert response.status_code in [400, 500]
 
+    def test_create_uses_current_environment(
+        self, client: TestClient, auth_headers: dict, db: Session, sample_account: Account
+    ):
+        """Test a transaction created in production mode can be read back."""
+        db.query(AppSettings).update({AppSettings.plaid_environment: "production"})
+        db.commit()
+        invalidate_settings_cache()
+
+        response = client.post(
+            "/api/v1/transactions",
+            json={
+                "account_id": sample_account.id,
+                "date": "2024-03-01T00:00:00",
+                "amount": -10.0,
+                "description": "Production purchase",
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        transaction_id = response.json()["id"]
+
+        response = client.get(f"/api/v1/transactions/{transaction_id}", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["description"] == "Production purchase"
+        response = client.get("/api/v1/transactions", headers=auth_headers)
+        assert response.json()["total"] == 1
+
 
 class TestUpdateTransaction:
     """Test PATCH /api/v1/transactions/{transaction_id} endpoint."""
@@ -298,6 +377,17 @@ class TestUpdateTransaction:
 
         assert response.status_code == 404
 
+    def test_update_transaction_empty_body(
+        self, client: TestClient, auth_headers: dict, sample_transaction: Transaction
+    ):
+        """Test an empty update returns the transaction unchanged."""
+        response = client.patch(
+            f"/api/v1/transactions/{sample_transaction.id}", json={}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["description"] == sample_transaction.description
+
 
 class TestDeleteTransaction:
     """Test DELETE /api/v1/transactions/{transaction_id} endpoint."""
@@ -360,3 +450,97 @@ class TestPendingTransactionWorkflow:
         )
         assert update_response.status_code == 200
         assert update_response.json()["pending"] is False
+
+
+class TestBulkCreateTransactions:
+    """Test POST /api/v1/transactions/bulk endpoint."""
+
+    @pytest.mark.parametrize("insert_returning", [True, False])
+    def test_bulk_create(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        sample_account: Account,
+        sample_category: Category,
+        monkeypatch: pytest.MonkeyPatch,
+        insert_returning: bool,
+    ):
+        """Test creating several transactions in one request, with and without RETURNING."""
+        # Without RETURNING support (MySQL) the dialect also can't batch it
+        dialect = async_engine.sync_engine.dialect
+        for flag in (
+            "insert_returning",
+            "insert_executemany_returning",
+            "insert_executemany_returning_sort_by_parameter_order",
+        ):
+            monkeypatch.setattr(dialect, flag, insert_returning and getattr(dialect, flag))
+        payload = [
+            {
+                "account_id": sample_account.id,
+                "category_id": sample_category.id if i == 0 else None,
+                "date": f"2024-03-{i + 1:02d}T00:00:00",
+                "amount": -10.0 * (i + 1),
+                "description": f"Bulk transaction {i}",
+            }
+            for i in range(3)
+        ]
+
+        response = client.post("/api/v1/transactions/bulk", json=payload, headers=auth_headers)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert [t["description"] for t in data] == [p["description"] for p in payload]
+        assert data[0]["category"]["id"] == sample_category.id
+        assert len({t["transaction_id"] for t in data}) == 3
+
+        response = client.get("/api/v1/transactions", headers=auth_headers)
+        assert response.json()["total"] == 3
+
+    def test_bulk_create_uses_current_environment(
+        self, client: TestClient, auth_headers: dict, db: Session, sample_account: Account
+    ):
+        """Test bulk-created rows get the active environment and show up in the list."""
+        db.query(AppSettings).update({AppSettings.plaid_environment: "production"})
+        db.commit()
+        invalidate_settings_cache()
+
+        payload = [
+            {
+                "account_id": sample_account.id,
+                "date": "2024-03-01T00:00:00",
+                "amount": -10.0,
+                "description": "Bulk transaction",
+            }
+        ]
+        response = client.post("/api/v1/transactions/bulk", json=payload, headers=auth_headers)
+
+        assert response.status_code == 201
+        assert db.query(Transaction.environment).scalar() == "production"
+        response = client.get("/api/v1/transactions", headers=auth_headers)
+        assert response.json()["total"] == 1
+
+    def test_bulk_create_rejects_foreign_account(
+        self, client: TestClient, auth_headers: dict, sample_account: Account
+    ):
+        """Test bulk create fails if any account isn't owned by the user."""
+        payload = [
+            {
+                "account_id": account_id,
+                "date": "2024-03-01T00:00:00",
+                "amount": -10.0,
+                "description": "Bulk transaction",
+            }
+            for account_id in (sample_account.id, 999)
+        ]
+
+        response = client.post("/api/v1/transactions/bulk", json=payload, headers=auth_headers)
+
+        assert response.status_code == 400
+        response = client.get("/api/v1/transactions", headers=auth_headers)
+        assert response.json()["total"] == 0
+
+    def test_bulk_create_empty(self, client: TestClient, auth_headers: dict):
+        """Test an empty batch is rejected."""
+        response = client.post("/api/v1/transactions/bulk", json=[], headers=auth_headers)
+
+        assert response.status_code == 422